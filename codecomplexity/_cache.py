@@ -0,0 +1,223 @@
+"""
+Code Complexity Analyzer - Result Cache
+
+This module provides a small persistent cache for analysis results, keyed
+by a hash of the analyzed source code, or by a file's path, modification
+time and size. Re-running the tool over files that haven't changed can then
+skip parsing and analysis entirely, and with the second kind of key even
+reading the file.
+
+Entries are stored one per file under ~/.cache/codecomplexity (or
+$XDG_CACHE_HOME/codecomplexity) and written atomically, so several
+processes can share the cache safely. Entries are dropped once they
+haven't been used for MAX_AGE_DAYS, so results for files that have since
+been edited, or from an older CACHE_VERSION, don't pile up. Set CODECOMPLEXITY_NO_CACHE=1
+to disable it.
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# Bump this whenever the analyzers change what they report, so results
+# cached by an older version are never reused
+CACHE_VERSION = 1
+
+# Entries last used longer ago than this are deleted; one that's needed
+# again is simply analyzed and written again
+MAX_AGE_DAYS = 30
+
+# The cache directory is swept for old entries at most this often, which a
+# marker file's modification time keeps track of across processes
+_PRUNE_INTERVAL = 24 * 60 * 60
+_PRUNE_MARKER = '.last-prune'
+
+# Whether this process has already checked if a sweep is due
+_prune_checked = False
+
+
+def _cache_dir() -> Path:
+    """
+    Get the directory that holds cache entries.
+    
+    Returns:
+        Path to the cache directory (it may not exist yet)
+        
+    Created: October 14, 2026
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'codecomplexity'
+
+
+def enabled() -> bool:
+    """
+    Check whether the cache should be used.
+    
+    Returns:
+        False if the CODECOMPLEXITY_NO_CACHE environment variable is set
+        
+    Created: October 14, 2026
+    """
+    return not os.environ.get('CODECOMPLEXITY_NO_CACHE')
+
+
+def make_key(source: bytes) -> str:
+    """
+    Build a cache key from the raw bytes of a source file.
+    
+    Args:
+        source: The file contents
+        
+    Returns:
+        Hex digest identifying this source for the current cache version
+        
+    Created: October 14, 2026
+    """
+    digest = hashlib.blake2b(source, digest_size=16, person=b'ccv%d' % CACHE_VERSION)
+    return digest.hexdigest()
+
+
+def make_file_key(filepath: str, mtime_ns: int, size: int, analyzer: str = '') -> str:
+    """
+    Build a cache key from a file's identity, without reading the file.
+    
+    Any edit changes the modification time or size, and so the key. This
+    is the same trade-off linters make: an edit that keeps both identical
+    (e.g. a restored timestamp) won't be noticed until the next change.
+    
+    Args:
+        filepath: Path to the file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        analyzer: Name of the analyzer, for files that can be analyzed in
+                  more than one way
+                  
+    Returns:
+        Hex digest identifying this version of the file for the current
+        cache version
+        
+    Created: October 14, 2026
+    """
+    identity = f"{os.path.abspath(filepath)}\0{mtime_ns}\0{size}\0{analyzer}"
+    digest = hashlib.blake2b(
+        identity.encode('utf-8', 'surrogateescape'),
+        digest_size=16,
+        person=b'ccf%d' % CACHE_VERSION
+    )
+    return digest.hexdigest()
+
+
+def get(key: str) -> Any | None:
+    """
+    Look up a cached value.
+    
+    A hit refreshes the entry's modification time, which is what _prune
+    goes by, so entries in constant use are never swept. To save a
+    metadata write on every hit, that's done at most once per
+    _PRUNE_INTERVAL.
+    
+    Args:
+        key: Key returned by make_key() or make_file_key()
+        
+    Returns:
+        The cached value, or None on a miss or an unreadable entry
+        
+    Created: October 14, 2026
+    """
+    path = _cache_dir() / key
+    try:
+        with open(path, 'rb') as f:
+            value = pickle.load(f)
+            mtime = os.fstat(f.fileno()).st_mtime
+    except (OSError, pickle.PickleError, EOFError, AttributeError, ValueError):
+        # A missing or corrupt entry is just a cache miss
+        return None
+    
+    if time.time() - mtime >= _PRUNE_INTERVAL:
+        try:
+            os.utime(path)
+        except OSError:
+            # E.g. a read-only cache shared with other users
+            pass
+    return value
+
+
+def put(key: str, value: Any) -> None:
+    """
+    Store a value in the cache.
+    
+    The entry is written to a temporary file first and then renamed into
+    place, so readers never see a half-written entry. Failures (read-only
+    home directory, full disk, ...) are ignored since the cache is only an
+    optimization.
+    
+    Args:
+        key: Key returned by make_key() or make_file_key()
+        value: Any picklable value
+        
+    Created: October 14, 2026
+    """
+    directory = _cache_dir()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=5)
+            os.replace(tmp_path, directory / key)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        
+        global _prune_checked
+        if not _prune_checked:
+            _prune_checked = True
+            _prune(directory)
+    except OSError:
+        pass
+
+
+def _prune(directory: Path) -> None:
+    """
+    Delete cache entries unused for MAX_AGE_DAYS, if a sweep is due.
+    
+    Sweeps run at most once per _PRUNE_INTERVAL, whichever process gets
+    there first, so a normal run doesn't pay for listing the directory.
+    Leftover temporary files from interrupted writes are swept too.
+    
+    Args:
+        directory: The cache directory
+        
+    Raises:
+        OSError: If the marker file can't be written
+        
+    Created: October 14, 2026
+    """
+    marker = directory / _PRUNE_MARKER
+    now = time.time()
+    try:
+        if now - marker.stat().st_mtime < _PRUNE_INTERVAL:
+            return
+    except FileNotFoundError:
+        pass
+    # Claim the sweep before starting it so other processes skip theirs
+    marker.touch()
+    
+    cutoff = now - MAX_AGE_DAYS * 24 * 60 * 60
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name == _PRUNE_MARKER:
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                # Removed by another process, or not ours to remove
+                pass
@@ -0,0 +1,57 @@
+"""
+Code Complexity Analyzer - Process Pool
+
+This module spreads per-file analysis over worker processes. Each file is
+an independent, CPU-bound parse, and ast.parse, pycparser and our visitors
+all hold the GIL, so separate processes are the only way to use more than
+one core. The batch functions in analyzer.py and c_analyzer.py and the
+parallel path of scanner.analyze_directory all go through map_files, so
+they hand out work the same way.
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Iterator, Sequence
+
+
+def map_files(func: Callable, paths: Sequence, *args: Any, jobs: int) -> Iterator:
+    """
+    Yield func(path, *args) for each path, in the order of paths.
+    
+    Files are handed to the workers in chunks, so each worker gets several
+    files per round trip, which keeps the pickling overhead down. Results
+    are still yielded one at a time as they're ready, in order. With one
+    job, or at most one file, no pool is started and func runs here.
+    
+    Args:
+        func: Module-level function to call, so workers can unpickle it
+        paths: Files to process
+        *args: Further arguments, passed to every call
+        jobs: Maximum number of worker processes. On platforms that spawn
+              workers (Windows, macOS) the calling script's entry point
+              needs an 'if __name__ == "__main__":' guard
+              
+    Yields:
+        Each call's return value, in the order of paths
+        
+    Raises:
+        ValueError: If jobs is less than 1
+        Any exception raised by func, when its result is reached
+        
+    Created: October 14, 2026
+    """
+    if jobs < 1:
+        raise ValueError("the number of worker processes must be at least 1")
+    
+    jobs = min(jobs, len(paths))
+    constant_args = [repeat(arg) for arg in args]
+    if jobs <= 1:
+        yield from map(func, paths, *constant_args)
+        return
+    
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(func, paths, *constant_args, chunksize=chunksize)
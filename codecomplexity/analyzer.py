@@ -7,13 +7,54 @@ code, and maximum nesting depth.
 
 Author: Dylan
 Created: January 31, 2026
-Last Modified: January 31, 2026
+Last Modified: October 14, 2026
 """
 
 import ast
+import mmap
+import os
+import re
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 from typing import Dict, List, Any
 
+from . import _cache, _pool
+
+
+# Matches the start of every line that holds actual code: optional leading
+# whitespace followed by anything that isn't whitespace or a comment marker.
+# Counting matches over a block of source is equivalent to counting the
+# lines where line.strip() is non-empty and doesn't start with '#', but the
+# scan runs in C instead of allocating stripped strings per line. It works
+# on the raw bytes of the file so the source never has to be decoded.
+_LOC_RE = re.compile(rb'^[^\S\n]*[^\s#]', re.MULTILINE)
+
+# The same for sources containing \r: re's ^ only knows \n, but the
+# compiler also ends lines at a bare \r, so a line starts at the beginning
+# of the block or after either character. This form is about half as fast,
+# so it's only used where it's needed
+_LOC_ANY_NEWLINE_RE = re.compile(rb'(?<![^\r\n])[^\S\r\n]*[^\s#]')
+
+# Line ends, used to index memory-mapped sources that can't be split()
+_NEWLINE_RE = re.compile(rb'\r\n?|\n')
+
+# Files larger than this are memory-mapped rather than read into memory
+_MMAP_THRESHOLD = 256 * 1024
+
+# Node types that can never contain anything affecting our metrics: names,
+# constants, and the context/operator singletons hanging off expressions.
+# The walk doesn't look inside these at all. Attribute, Subscript and Call
+# are deliberately not here since they can hold BoolOps and lambdas.
+_LEAF_TYPES = frozenset(
+    [ast.Name, ast.Constant]
+    + ast.expr_context.__subclasses__()
+    + ast.boolop.__subclasses__()
+    + ast.operator.__subclasses__()
+    + ast.unaryop.__subclasses__()
+    + ast.cmpop.__subclasses__()
+)
+
 
 class FunctionMetrics:
     """
@@ -29,9 +70,22 @@ class FunctionMetrics:
         cyclomatic_complexity (int): McCabe complexity score (starts at 1)
         max_nesting_depth (int): Maximum depth of nested control structures
     
+    The attributes are declared in __slots__, so instances carry no
+    per-instance __dict__. This keeps large projects' results small and
+    makes the frequent complexity updates during a walk cheaper.
+    
     Created: January 31, 2026
+    Last Modified: October 14, 2026
     """
     
+    __slots__ = (
+        'name',
+        'lineno',
+        'lines_of_code',
+        'cyclomatic_complexity',
+        'max_nesting_depth',
+    )
+    
     def __init__(self, name: str, lineno: int):
         """
         Initialize a new FunctionMetrics object.
@@ -52,68 +106,152 @@ class FunctionMetrics:
         self.max_nesting_depth = 0
 
 
-class PythonAnalyzer(ast.NodeVisitor):
+class PythonAnalyzer:
     """
-    AST visitor that traverses Python code and calculates complexity metrics.
+    AST walker that traverses Python code and calculates complexity metrics.
     
-    This class extends Python's ast.NodeVisitor to walk through the Abstract
-    Syntax Tree (AST) of Python source code. As it visits each node, it
-    calculates various complexity metrics.
+    This class walks the Abstract Syntax Tree (AST) of Python source code
+    and calculates various complexity metrics as it goes. Instead of
+    recursing through ast.NodeVisitor (which builds a 'visit_' + class name
+    string and does a getattr for every node), it runs a single loop over
+    an explicit stack and looks each node's handler up in a dispatch table
+    keyed by node type.
     
-    The visitor pattern allows us to define custom behavior for each type
-    of AST node (functions, if statements, loops, etc.) without modifying
-    the AST itself.
+    Handlers that open a new scope (functions, branches, with blocks)
+    return an exit marker that is pushed below the node's children. The
+    marker is popped once every child has been processed, which gives the
+    same enter/exit ordering a recursive visitor would.
     
     Attributes:
-        source_code (str): The raw Python source code being analyzed
-        source_lines (List[str]): Source code split into individual lines
+        source_bytes (bytes | mmap.mmap): The raw Python source code being analyzed
+        line_offsets (List[int]): Offset of the first byte of each line
         functions (List[FunctionMetrics]): List of all analyzed functions
         current_function (FunctionMetrics | None): The function currently being analyzed
         nesting_depth (int): Current depth in nested control structures
     
     Created: January 31, 2026
+    Last Modified: October 14, 2026
     """
     
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: bytes | mmap.mmap | str):
         """
         Initialize the analyzer with source code to analyze.
         
         Args:
-            source_code: The complete Python source code as a string
+            source_code: The complete Python source code, preferably as the
+                raw bytes read from the file or a read-only mmap of it
+                (text is encoded as UTF-8)
             
-        The source code is stored both as a complete string and as individual
-        lines to facilitate different types of analysis (AST parsing vs line counting).
+        The offset at which each line starts is recorded up front (with one
+        extra entry marking the end of the source) so that line counting can
+        slice out a function's text directly instead of joining lines. Lines
+        end in \n, \r\n or \r, the same as for the compiler's line numbers.
         
         Created: January 31, 2026
+        Last Modified: October 14, 2026
         """
-        self.source_code = source_code
-        self.source_lines = source_code.split('\n')
+        if isinstance(source_code, str):
+            source_code = source_code.encode('utf-8')
+        self.source_bytes = source_code
+        if isinstance(source_code, bytes):
+            # bytes.splitlines() splits on exactly those three line ends
+            self.line_offsets = list(accumulate(
+                map(len, source_code.splitlines(keepends=True)),
+                initial=0
+            ))
+        else:
+            # mmap has no splitlines(); find the line ends in place instead
+            # so the mapped file is never copied as a whole
+            self.line_offsets = [0]
+            self.line_offsets.extend(m.end() for m in _NEWLINE_RE.finditer(source_code))
+        if self.line_offsets[-1] != len(source_code):
+            # The last line has no line end of its own
+            self.line_offsets.append(len(source_code))
+        self._loc_re = _LOC_RE if source_code.find(b'\r') == -1 else _LOC_ANY_NEWLINE_RE
         self.functions: List[FunctionMetrics] = []
         self.current_function: FunctionMetrics | None = None
         self.nesting_depth = 0
     
-    def visit_FunctionDef(self, node: ast.FunctionDef):
+    def analyze(self, tree: ast.AST) -> None:
+        """
+        Walk an entire AST and collect metrics for every function in it.
+        
+        This is an iterative depth-first traversal. Children are pushed in
+        reverse so they are popped in source order, and exit markers (plain
+        tuples of handler and saved state) are pushed before the children
+        so they run after the whole subtree has been processed.
+        
+        Args:
+            tree: The root AST node, usually the parsed module
+            
+        Created: October 14, 2026
+        """
+        handlers = self._ENTER_HANDLERS
+        leaf_types = _LEAF_TYPES
+        node_type = ast.AST
+        stack: List[Any] = [tree]
+        
+        while stack:
+            item = stack.pop()
+            item_type = type(item)
+            
+            # Exit markers are tuples; AST nodes never are
+            if item_type is tuple:
+                exit_handler, state = item
+                exit_handler(self, state)
+                continue
+            
+            # Names, constants and operators have nothing below them that
+            # could change a metric, so don't bother enumerating children
+            if item_type in leaf_types:
+                continue
+            
+            # Run the enter handler for node types that affect our metrics
+            handler = handlers.get(item_type)
+            if handler is not None:
+                exit_marker = handler(self, item)
+                if exit_marker is not None:
+                    stack.append(exit_marker)
+            
+            # Queue the children so the first one is processed next
+            # This is ast.iter_child_nodes inlined: walking _fields directly
+            # avoids creating two generator frames for every node in the tree
+            children = []
+            for field in item._fields:
+                value = getattr(item, field, None)
+                if isinstance(value, node_type):
+                    children.append(value)
+                elif isinstance(value, list):
+                    for child in value:
+                        if isinstance(child, node_type):
+                            children.append(child)
+            children.reverse()
+            stack.extend(children)
+    
+    def _enter_function(self, node: ast.FunctionDef):
         """
-        Visit a function definition node and calculate its metrics.
+        Enter a function definition node and start tracking its metrics.
         
-        This is called automatically by the AST visitor when it encounters
-        a function definition. It creates a new FunctionMetrics object,
-        calculates all metrics for the function, then continues visiting
-        the function's child nodes.
+        This is called when the walk reaches a function definition. It
+        creates a new FunctionMetrics object, calculates its lines of code,
+        and makes it the current function while its body is processed.
         
         Args:
             node: The AST node representing the function definition
             
+        Returns:
+            Exit marker that restores the enclosing function context
+            
         The method uses a stack-based approach to handle nested functions:
-        - Save the current function context
+        - Save the current function context (in the exit marker)
         - Analyze the new function
-        - Restore the previous context
+        - Restore the previous context (in _exit_function)
         
         This ensures that metrics for inner functions don't affect outer
         function metrics.
         
         Created: January 31, 2026
-        Last Modified: January 31, 2026
+        Last Modified: October 14, 2026
         """
         # Create a new metrics object for this function
         func = FunctionMetrics(node.name, node.lineno)
@@ -124,21 +262,28 @@ class PythonAnalyzer(ast.NodeVisitor):
         
         # Save the current function context so we can restore it later
         # This is critical for handling nested functions correctly
-        previous_function = self.current_function
+        state = (func, self.current_function, self.nesting_depth)
         self.current_function = func
         
         # Reset nesting depth for this new function scope
         # Each function starts at depth 0
-        previous_depth = self.nesting_depth
         self.nesting_depth = 0
         
-        # Visit all child nodes (statements inside the function)
-        # This is where we'll encounter if/for/while statements that
-        # contribute to complexity and nesting depth
-        self.generic_visit(node)
+        return (PythonAnalyzer._exit_function, state)
+    
+    def _exit_function(self, state):
+        """
+        Leave a function definition once its whole body has been processed.
+        
+        Args:
+            state: Tuple of (function metrics, previous function, previous depth)
+            
+        Created: October 14, 2026
+        """
+        func, previous_function, previous_depth = state
         
         # Store the maximum nesting depth we encountered
-        # This is tracked during the visit of child nodes
+        # This is tracked while the function's children are processed
         func.max_nesting_depth = self.nesting_depth
         
         # Restore the previous function context
@@ -149,107 +294,57 @@ class PythonAnalyzer(ast.NodeVisitor):
         # Add this function's metrics to our results list
         self.functions.append(func)
     
-    def visit_If(self, node: ast.If):
+    def _exit_nesting(self, state):
         """
-        Visit an if statement and update complexity metrics.
-        
-        If statements create branching paths in the code, which increases
-        cyclomatic complexity. Each if/elif/else block represents a decision
-        point that adds one to the complexity score.
+        Leave a nested block (branch, loop, handler or with statement).
         
         Args:
-            node: The AST node representing the if statement
+            state: Unused; present so all exit handlers share one signature
             
-        Nesting depth is also tracked here because if statements can be
-        nested inside each other or inside loops.
-        
-        Created: January 31, 2026
+        Created: October 14, 2026
         """
-        # Only increment complexity if we're inside a function
-        # Top-level if statements don't contribute to function complexity
-        if self.current_function:
-            self.current_function.cyclomatic_complexity += 1
-        
-        # Track that we've entered a nested structure
-        self.nesting_depth += 1
-        
-        # Continue visiting child nodes (code inside the if block)
-        self.generic_visit(node)
-        
         # We've exited this level of nesting
         self.nesting_depth -= 1
     
-    def visit_For(self, node: ast.For):
-        """
-        Visit a for loop and update complexity metrics.
-        
-        For loops add to cyclomatic complexity because they represent
-        a decision point: the loop condition that determines whether to
-        continue iterating or exit the loop.
-        
-        Args:
-            node: The AST node representing the for loop
-            
-        Created: January 31, 2026
-        """
-        # Increment complexity for this decision point
-        if self.current_function:
-            self.current_function.cyclomatic_complexity += 1
-        
-        # Track nesting depth as we enter the loop body
-        self.nesting_depth += 1
-        self.generic_visit(node)
-        self.nesting_depth -= 1
+    # Shared exit marker for every block that only adjusts nesting depth
+    _NESTING_EXIT = (_exit_nesting, None)
     
-    def visit_While(self, node: ast.While):
+    def _enter_branch(self, node: ast.AST):
         """
-        Visit a while loop and update complexity metrics.
-        
-        While loops are similar to for loops in their contribution to
-        complexity - they represent a decision point with a condition
-        that's evaluated on each iteration.
+        Enter a branching statement and update complexity metrics.
         
-        Args:
-            node: The AST node representing the while loop
-            
-        Created: January 31, 2026
-        """
-        # Increment complexity for the loop condition
-        if self.current_function:
-            self.current_function.cyclomatic_complexity += 1
-        
-        # Track nesting as we enter the loop body
-        self.nesting_depth += 1
-        self.generic_visit(node)
-        self.nesting_depth -= 1
-    
-    def visit_ExceptHandler(self, node: ast.ExceptHandler):
-        """
-        Visit an exception handler (except block) and update complexity.
+        This one handler covers every statement that adds a decision point:
+        - if/elif: each condition creates a separate path through the code
+        - for/while: the loop condition decides whether to keep iterating
+        - except: raising an exception can branch into the handler
         
-        Exception handlers add to complexity because they represent an
-        alternative execution path. When an exception is raised, the code
-        can branch to the except handler instead of continuing normally.
+        Each of these adds one to the complexity score and opens a nested
+        block. Note: Each except block in a try/except chain adds its own
+        complexity.
         
         Args:
-            node: The AST node representing the except handler
+            node: An If, For, While or ExceptHandler node
+            
+        Returns:
+            Exit marker that restores the nesting depth
             
-        Note: Each except block in a try/except chain adds its own complexity.
-        
         Created: January 31, 2026
+        Last Modified: October 14, 2026
         """
-        # Each exception handler is a potential execution path
-        if self.current_function:
-            self.current_function.cyclomatic_complexity += 1
+        # Only increment complexity if we're inside a function
+        # Top-level branches don't contribute to function complexity
+        # (read the attribute once; this handler runs for every branch node)
+        func = self.current_function
+        if func is not None:
+            func.cyclomatic_complexity += 1
         
-        # Track nesting depth within the except block
+        # Track that we've entered a nested structure
         self.nesting_depth += 1
-        self.generic_visit(node)
-        self.nesting_depth -= 1
+        return self._NESTING_EXIT
     
-    def visit_With(self, node: ast.With):
+    def _enter_with(self, node: ast.With):
         """
-        Visit a with statement (context manager) and track nesting.
+        Enter a with statement (context manager) and track nesting.
         
         With statements don't add to cyclomatic complexity (they don't
         create branching), but they do add to nesting depth since they
@@ -258,16 +353,19 @@ class PythonAnalyzer(ast.NodeVisitor):
         Args:
             node: The AST node representing the with statement
             
+        Returns:
+            Exit marker that restores the nesting depth
+            
         Created: January 31, 2026
+        Last Modified: October 14, 2026
         """
         # With statements increase nesting but not complexity
         self.nesting_depth += 1
-        self.generic_visit(node)
-        self.nesting_depth -= 1
+        return self._NESTING_EXIT
     
-    def visit_BoolOp(self, node: ast.BoolOp):
+    def _enter_bool_op(self, node: ast.BoolOp):
         """
-        Visit a boolean operation (and/or) and update complexity.
+        Enter a boolean operation (and/or) and update complexity.
         
         Boolean operators like 'and' and 'or' add to cyclomatic complexity
         because they create additional decision points. For example:
@@ -277,6 +375,9 @@ class PythonAnalyzer(ast.NodeVisitor):
         Args:
             node: The AST node representing the boolean operation
             
+        Returns:
+            None, since boolean operations don't open a nested block
+            
         The complexity increase is (number of conditions - 1) because the
         first condition is already counted by the parent if/while/etc.
         
@@ -284,15 +385,28 @@ class PythonAnalyzer(ast.NodeVisitor):
             if a and b and c:  # Three values = +2 complexity
             
         Created: January 31, 2026
+        Last Modified: October 14, 2026
         """
-        if self.current_function:
+        func = self.current_function
+        if func is not None:
             # node.values contains all the operands in the boolean expression
             # If we have "a and b and c", node.values has 3 elements
             # We add (3 - 1) = 2 to complexity
-            self.current_function.cyclomatic_complexity += len(node.values) - 1
+            func.cyclomatic_complexity += len(node.values) - 1
         
-        # Continue visiting child nodes
-        self.generic_visit(node)
+        return None
+    
+    # Dispatch table used by analyze(): node type -> enter handler
+    # Node types missing from this table are walked without side effects
+    _ENTER_HANDLERS = {
+        ast.FunctionDef: _enter_function,
+        ast.If: _enter_branch,
+        ast.For: _enter_branch,
+        ast.While: _enter_branch,
+        ast.ExceptHandler: _enter_branch,
+        ast.With: _enter_with,
+        ast.BoolOp: _enter_bool_op,
+    }
     
     def _calculate_loc(self, node: ast.FunctionDef) -> int:
         """
@@ -310,43 +424,29 @@ class PythonAnalyzer(ast.NodeVisitor):
             int: The number of actual code lines in the function
             
         The calculation works by:
-        1. Finding the start and end line numbers from the AST
-        2. Extracting those lines from the source code
-        3. Filtering out blank and comment lines
-        4. Counting what remains
+        1. Reading the start and end line numbers from the function node
+        2. Slicing the text of those lines out of the source code
+        3. Counting the lines that start with code using a precompiled regex
         
         Created: January 31, 2026
+        Last Modified: October 14, 2026
         """
         # Convert to 0-indexed (Python lists are 0-indexed but line numbers are 1-indexed)
         start_line = node.lineno - 1
         
-        # Find the last line of the function by walking the entire AST subtree
-        # We need to check all nodes because the function might contain nested
-        # structures that extend beyond simple sequential statements
-        if node.body:
-            # Get the maximum end_lineno from all nodes in the function
-            # This handles cases where the last statement spans multiple lines
-            end_line = max(
-                getattr(stmt, 'end_lineno', stmt.lineno) 
-                for stmt in ast.walk(node)
-                if hasattr(stmt, 'lineno')
-            )
-        else:
-            # Empty function - just the def line
-            end_line = node.lineno
+        # The parser records where every node ends, so the function's own
+        # end_lineno already covers its last (possibly multi-line) statement.
+        # This avoids re-walking the whole subtree for every function, which
+        # made nested functions quadratic. ast.parse always sets it on
+        # Python 3.8+, so read it directly instead of probing with getattr.
+        end_line = node.end_lineno
         
-        # Extract the relevant lines from the source code
-        lines = self.source_lines[start_line:end_line]
+        # Slice out the text of the function's lines in one go
+        text = self.source_bytes[self.line_offsets[start_line]:self.line_offsets[end_line]]
         
         # Count lines that are not blank and not pure comments
-        # strip() removes leading/trailing whitespace
-        # We check if the stripped line exists and doesn't start with #
-        loc = sum(
-            1 for line in lines 
-            if line.strip() and not line.strip().startswith('#')
-        )
-        
-        return loc
+        # The regex matches once per line that starts with real code
+        return len(self._loc_re.findall(text))
 
 
 def analyze_python_file(filepath: Path) -> List[FunctionMetrics]:
@@ -354,10 +454,13 @@ def analyze_python_file(filepath: Path) -> List[FunctionMetrics]:
     Analyze a Python file and return complexity metrics for all functions.
     
     This is the main entry point for analyzing a single Python file. It:
-    1. Reads the source code from the file
-    2. Parses it into an Abstract Syntax Tree (AST)
-    3. Walks the AST to calculate metrics
-    4. Returns a list of metrics for all functions found
+    1. Returns the previous result if the file hasn't changed since it was
+       last analyzed in this process (same path, mtime and size)
+    2. Reads the source code from the file
+    3. Returns cached metrics if this exact source was analyzed before
+    4. Parses it into an Abstract Syntax Tree (AST)
+    5. Walks the AST to calculate metrics
+    6. Caches and returns a list of metrics for all functions found
     
     Args:
         filepath: Path object pointing to the Python file to analyze
@@ -367,8 +470,8 @@ def analyze_python_file(filepath: Path) -> List[FunctionMetrics]:
         
     Raises:
         FileNotFoundError: If the specified file doesn't exist
-        SyntaxError: If the Python file has syntax errors
-        UnicodeDecodeError: If the file encoding is not UTF-8
+        SyntaxError: If the Python file has syntax errors or can't be
+            decoded with its declared encoding (UTF-8 by default)
         
     Example:
         >>> from pathlib import Path
@@ -376,21 +479,278 @@ def analyze_python_file(filepath: Path) -> List[FunctionMetrics]:
         >>> for func in metrics:
         ...     print(f"{func.name}: complexity={func.cyclomatic_complexity}")
         
+    Note: Results from the in-process memo share their FunctionMetrics
+    objects between calls, so callers shouldn't modify them.
+        
     Created: January 31, 2026
+    Last Modified: October 14, 2026
+    """
+    # Any edit to the file changes its mtime or size, which gives a new
+    # memo key and forces a fresh analysis
+    st = os.stat(filepath)
+    return list(_analyze_python_file_memo(os.fspath(filepath), st.st_mtime_ns, st.st_size))
+
+
+def analyze_python_files(
+    paths: List[Path],
+    workers: int | None = None
+) -> Dict[Path, List[FunctionMetrics]]:
+    """
+    Analyze several Python files in parallel using a process pool.
+    
+    Each file is analyzed independently with analyze_python_file, spread
+    over worker processes by _pool.map_files. Separate processes sidestep
+    the GIL, which both ast.parse and the visitor hold for their whole run.
+    A single file, or a single worker, is analyzed in this process.
+    
+    Args:
+        paths: List of Python files to analyze
+        workers: Number of worker processes (default: os.cpu_count())
+        
+    Returns:
+        Dictionary mapping each path to its list of FunctionMetrics, in the
+        same order as the input paths
+        
+    Raises:
+        ValueError: If workers is less than 1
+        Any exception raised by analyze_python_file for one of the files
+        
+    Created: October 14, 2026
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return dict(zip(paths, _pool.map_files(analyze_python_file, paths, jobs=workers)))
+
+
+def analyze_python_source(
+    source: bytes | mmap.mmap,
+    filepath: Path | str = '<unknown>',
+    use_cache: bool = True
+) -> List[FunctionMetrics]:
     """
-    # Read the entire source file
-    # Using UTF-8 encoding as it's the standard for Python files
-    with open(filepath, 'r', encoding='utf-8') as f:
-        source_code = f.read()
+    Analyze Python source that has already been read and return its metrics.
+    
+    This is analyze_python_file without the file access, for callers that
+    read files themselves, e.g. ahead of time on another thread. By default
+    the persistent cache is still used, keyed by the source bytes.
+    
+    Args:
+        source: The raw file contents, as bytes or a read-only mmap; they're
+                decoded the way the interpreter would, honouring BOMs and
+                coding cookies
+        filepath: Path the source came from, used in error messages
+        use_cache: If False, skip the persistent cache, for callers that
+                   cache the result under a key of their own
+        
+    Returns:
+        List of FunctionMetrics objects, one for each function in the source
+        
+    Raises:
+        SyntaxError: If the source has syntax errors or can't be decoded
+        
+    Example:
+        >>> from pathlib import Path
+        >>> path = Path("my_script.py")
+        >>> metrics = analyze_python_source(path.read_bytes(), path)
+        
+    Created: October 14, 2026
+    """
+    return _analyze_source(os.fspath(filepath), source, use_cache)
+
+
+@lru_cache(maxsize=4096)
+def _analyze_python_file_memo(filepath: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Memoized wrapper around _analyze_python_file_uncached.
+    
+    The mtime and size are only part of the memo key; they aren't used
+    otherwise. Errors aren't memoized, so a fixed file is picked up again.
+    
+    Args:
+        filepath: Path to the Python file to analyze
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Tuple of FunctionMetrics objects for the file
+        
+    Created: October 14, 2026
+    """
+    return tuple(_analyze_python_file_uncached(filepath, size))
+
+
+def _analyze_python_file_uncached(filepath: str, size: int) -> List[FunctionMetrics]:
+    """
+    Read, parse and analyze a Python file, using the persistent cache.
+    
+    Args:
+        filepath: Path to the Python file to analyze
+        size: Size of the file in bytes, as reported by os.stat
+        
+    Returns:
+        List of FunctionMetrics objects, one for each function in the file
+        
+    Created: October 14, 2026
+    """
+    # Large files are memory-mapped instead of read, so the parser, the
+    # cache hash and the LOC scan all work straight from the page cache
+    # without a file-sized bytes copy. Small files are cheaper to read
+    if size > _MMAP_THRESHOLD:
+        with _map_source(filepath) as source_code:
+            return _analyze_source(filepath, source_code)
+    
+    # Read the entire source file as raw bytes
+    # ast.parse decodes them itself, honouring BOMs and coding cookies,
+    # so there's no separate decoded copy of the source to keep around
+    return _analyze_source(filepath, _read_source(filepath))
+
+
+def _analyze_source(
+    filepath: str,
+    source_code: bytes | mmap.mmap,
+    use_cache: bool = True
+) -> List[FunctionMetrics]:
+    """
+    Parse and analyze the raw source of a Python file, using the persistent cache.
+    
+    Args:
+        filepath: Path to the Python file, used in error messages
+        source_code: The file contents as bytes or a read-only mmap
+        use_cache: If False, skip the persistent cache
+        
+    Returns:
+        List of FunctionMetrics objects, one for each function in the file
+        
+    Created: October 14, 2026
+    """
+    # Unchanged files hash to the same key, so a hit lets us skip both
+    # parsing and the walk. Metrics are cached as plain tuples to keep
+    # entries small and independent of the FunctionMetrics class layout
+    use_cache = use_cache and _cache.enabled()
+    if use_cache:
+        cache_key = _cache.make_key(source_code)
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            return [_metrics_from_tuple(row) for row in cached]
     
     # Parse the source code into an Abstract Syntax Tree
+    # This is what ast.parse does under the hood; calling compile directly
+    # skips the wrapper and makes sure type comments stay switched off.
     # The filename parameter is used in error messages if parsing fails
-    tree = ast.parse(source_code, filename=str(filepath))
+    tree = compile(
+        source_code,
+        filepath,
+        'exec',
+        flags=ast.PyCF_ONLY_AST,
+        dont_inherit=True,
+        optimize=0
+    )
     
     # Create an analyzer instance and walk the AST
-    # The visitor pattern will call our visit_* methods for each node type
+    # The dispatch table calls our _enter_* handlers for each node type
     analyzer = PythonAnalyzer(source_code)
-    analyzer.visit(tree)
+    analyzer.analyze(tree)
+    
+    if use_cache:
+        _cache.put(cache_key, [_metrics_to_tuple(m) for m in analyzer.functions])
     
     # Return all the function metrics we collected
-    return analyzer.functions
\ No newline at end of file
+    return analyzer.functions
+
+
+def _read_source(filepath: str) -> bytes:
+    """
+    Read the raw bytes of a source file.
+    
+    This goes straight through os.open/os.read instead of open(), which
+    would build a FileIO and a BufferedReader just to read the file once.
+    For projects with thousands of small files that setup cost is a
+    noticeable part of the total.
+    
+    Args:
+        filepath: Path to the file to read
+        
+    Returns:
+        The file contents
+        
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist
+        
+    Created: October 14, 2026
+    """
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        # A single read of the full size normally returns the whole file;
+        # keep reading until EOF in case it came back short
+        data = os.read(fd, os.fstat(fd).st_size)
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return data
+            data += chunk
+    finally:
+        os.close(fd)
+
+
+def _map_source(filepath: str) -> mmap.mmap:
+    """
+    Memory-map a source file read-only.
+    
+    Args:
+        filepath: Path to the file to map (must not be empty)
+        
+    Returns:
+        A read-only mmap of the whole file; close it when done
+        
+    Raises:
+        FileNotFoundError: If the specified file doesn't exist
+        
+    Created: October 14, 2026
+    """
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        # mmap keeps its own handle to the file, so ours can be closed
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+def _metrics_to_tuple(func: FunctionMetrics) -> tuple:
+    """
+    Convert a FunctionMetrics object to a plain tuple for caching.
+    
+    Args:
+        func: The metrics to convert
+        
+    Returns:
+        Tuple of (name, lineno, lines_of_code, complexity, nesting depth)
+        
+    Created: October 14, 2026
+    """
+    return (
+        func.name,
+        func.lineno,
+        func.lines_of_code,
+        func.cyclomatic_complexity,
+        func.max_nesting_depth
+    )
+
+
+def _metrics_from_tuple(row: tuple) -> FunctionMetrics:
+    """
+    Rebuild a FunctionMetrics object from a tuple made by _metrics_to_tuple.
+    
+    Args:
+        row: Tuple of (name, lineno, lines_of_code, complexity, nesting depth)
+        
+    Returns:
+        The equivalent FunctionMetrics object
+        
+    Created: October 14, 2026
+    """
+    name, lineno, lines_of_code, complexity, nesting = row
+    func = FunctionMetrics(name, lineno)
+    func.lines_of_code = lines_of_code
+    func.cyclomatic_complexity = complexity
+    func.max_nesting_depth = nesting
+    return func
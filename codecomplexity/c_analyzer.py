@@ -5,17 +5,41 @@ This module provides complexity analysis for C source files using pycparser.
 
 Author: Dylan
 Created: February 1, 2026
-Last Modified: February 1, 2026
+Last Modified: October 14, 2026
 """
 
+import os
+import threading
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 import pycparser
 from pycparser import c_ast
 
+from . import _pool
 from .analyzer import FunctionMetrics
 
 
+# Parsers are reused between files instead of being rebuilt per call.
+# CParser keeps lexer and scope state while parsing, so each thread gets its
+# own; worker processes each build theirs once
+_local = threading.local()
+
+
+def _get_parser() -> pycparser.CParser:
+    """
+    Return this thread's CParser, creating it on first use.
+    
+    Returns:
+        A CParser that is only ever used from the calling thread
+        
+    Created: October 14, 2026
+    """
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = pycparser.CParser()
+    return parser
+
+
 class CComplexityVisitor(c_ast.NodeVisitor):
     """
     AST visitor for analyzing C code complexity.
@@ -23,12 +47,17 @@ class CComplexityVisitor(c_ast.NodeVisitor):
     This class extends pycparser's NodeVisitor to calculate complexity
     metrics for C functions, similar to what we do for Python.
     
+    Everything is gathered in a single walk per function: control flow,
+    switch cases and the statement count used to estimate lines of code.
+    
     Attributes:
         functions: List of FunctionMetrics for analyzed functions
         current_function: The function currently being analyzed
         nesting_depth: Current nesting depth in control structures
+        statement_count: Statements counted so far in the current function
         
     Created: February 1, 2026
+    Last Modified: October 14, 2026
     """
     
     def __init__(self):
@@ -36,10 +65,16 @@ class CComplexityVisitor(c_ast.NodeVisitor):
         Initialize the C complexity visitor.
         
         Created: February 1, 2026
+        Last Modified: October 14, 2026
         """
         self.functions: List[FunctionMetrics] = []
         self.current_function: FunctionMetrics | None = None
         self.nesting_depth = 0
+        self.statement_count = 0
+        
+        # True while inside a counted statement, so expressions nested in
+        # it (e.g. a call inside a declaration) aren't counted again
+        self._in_statement = False
     
     def visit_FuncDef(self, node):
         """
@@ -49,6 +84,7 @@ class CComplexityVisitor(c_ast.NodeVisitor):
             node: The AST node representing the function definition
             
         Created: February 1, 2026
+        Last Modified: October 14, 2026
         """
         # Get function name
         func_name = node.decl.name
@@ -59,113 +95,99 @@ class CComplexityVisitor(c_ast.NodeVisitor):
         # Create metrics object
         func = FunctionMetrics(func_name, lineno)
         
-        # Calculate lines of code (approximate)
-        func.lines_of_code = self._estimate_loc(node)
-        
         # Save current state
         previous_function = self.current_function
         previous_depth = self.nesting_depth
+        previous_statements = self.statement_count
+        previous_in_statement = self._in_statement
         
         # Analyze this function
         self.current_function = func
         self.nesting_depth = 0
+        self.statement_count = 0
+        self._in_statement = False
         
-        # Visit children to count complexity
+        # Visit children to count complexity, cases and statements
         self.generic_visit(node)
         
         # Store max nesting depth
         func.max_nesting_depth = self.nesting_depth
         
+        # Lines of code are approximated by the statement count, since
+        # pycparser doesn't preserve all formatting information
+        func.lines_of_code = max(self.statement_count, 1)
+        
         # Restore state
         self.current_function = previous_function
         self.nesting_depth = previous_depth
+        self.statement_count = previous_statements
+        self._in_statement = previous_in_statement
         
         # Add to results
         self.functions.append(func)
     
-    def visit_If(self, node):
-        """
-        Visit an if statement.
-        
-        Args:
-            node: The AST node representing the if statement
-            
-        Created: February 1, 2026
+    def _visit_branch(self, node):
         """
-        if self.current_function:
-            self.current_function.cyclomatic_complexity += 1
+        Visit an if statement or a for, while or do-while loop.
         
-        self.nesting_depth += 1
-        self.generic_visit(node)
-        self.nesting_depth -= 1
-    
-    def visit_For(self, node):
-        """
-        Visit a for loop.
+        Each of these is a single decision point, so they all add one to
+        complexity and open one level of nesting.
         
         Args:
-            node: The AST node representing the for loop
+            node: An If, For, While or DoWhile node
             
         Created: February 1, 2026
+        Last Modified: October 14, 2026
         """
-        if self.current_function:
-            self.current_function.cyclomatic_complexity += 1
+        # Read each attribute once; this runs for every branch node
+        func = self.current_function
+        if func is not None:
+            func.cyclomatic_complexity += 1
         
-        self.nesting_depth += 1
+        depth = self.nesting_depth + 1
+        self.nesting_depth = depth
         self.generic_visit(node)
-        self.nesting_depth -= 1
+        self.nesting_depth = depth - 1
     
-    def visit_While(self, node):
-        """
-        Visit a while loop.
-        
-        Args:
-            node: The AST node representing the while loop
-            
-        Created: February 1, 2026
-        """
-        if self.current_function:
-            self.current_function.cyclomatic_complexity += 1
-        
-        self.nesting_depth += 1
-        self.generic_visit(node)
-        self.nesting_depth -= 1
+    visit_If = _visit_branch
+    visit_For = _visit_branch
+    visit_While = _visit_branch
+    visit_DoWhile = _visit_branch
     
-    def visit_DoWhile(self, node):
+    def visit_Switch(self, node):
         """
-        Visit a do-while loop.
+        Visit a switch statement.
+        
+        The switch itself doesn't add to complexity; each case does,
+        and those are counted by visit_Case as the walk reaches them.
         
         Args:
-            node: The AST node representing the do-while loop
+            node: The AST node representing the switch statement
             
         Created: February 1, 2026
+        Last Modified: October 14, 2026
         """
-        if self.current_function:
-            self.current_function.cyclomatic_complexity += 1
-        
-        self.nesting_depth += 1
+        depth = self.nesting_depth + 1
+        self.nesting_depth = depth
         self.generic_visit(node)
-        self.nesting_depth -= 1
+        self.nesting_depth = depth - 1
     
-    def visit_Switch(self, node):
+    def visit_Case(self, node):
         """
-        Visit a switch statement.
+        Visit a case label inside a switch statement.
         
-        Each case in a switch adds to complexity.
+        Each case adds one to complexity.
         
         Args:
-            node: The AST node representing the switch statement
+            node: The AST node representing the case label
             
-        Created: February 1, 2026
+        Created: October 14, 2026
         """
-        if self.current_function:
-            # Count the number of case statements
-            case_count = self._count_cases(node)
-            self.current_function.cyclomatic_complexity += case_count
+        func = self.current_function
+        if func is not None:
+            func.cyclomatic_complexity += 1
         
-        self.nesting_depth += 1
         self.generic_visit(node)
-        self.nesting_depth -= 1
     
     def visit_BinaryOp(self, node):
         """
@@ -175,76 +197,77 @@ class CComplexityVisitor(c_ast.NodeVisitor):
             node: The AST node representing the binary operation
             
         Created: February 1, 2026
+        Last Modified: October 14, 2026
         """
-        if self.current_function and node.op in ['&&', '||']:
-            self.current_function.cyclomatic_complexity += 1
+        func = self.current_function
+        if func is not None and node.op in ('&&', '||'):
+            func.cyclomatic_complexity += 1
         
         self.generic_visit(node)
     
-    def _count_cases(self, switch_node) -> int:
+    def _visit_statement(self, node):
         """
-        Count the number of case statements in a switch.
+        Visit a node that counts towards the lines of code estimate.
+        
+        Declarations, assignments, function calls and returns each count
+        once. Anything nested inside one of them is still visited for
+        complexity but isn't counted as another statement.
         
         Args:
-            switch_node: The switch statement AST node
+            node: A Decl, Assignment, FuncCall or Return node
             
-        Returns:
-            Number of case statements
-            
-        Created: February 1, 2026
+        Created: October 14, 2026
         """
-        count = 0
-        
-        class CaseCounter(c_ast.NodeVisitor):
-            def __init__(self):
-                self.count = 0
-            
-            def visit_Case(self, node):
-                self.count += 1
-        
-        counter = CaseCounter()
-        counter.visit(switch_node)
-        return counter.count
+        if self.current_function and not self._in_statement:
+            self.statement_count += 1
+            self._in_statement = True
+            self.generic_visit(node)
+            self._in_statement = False
+        else:
+            self.generic_visit(node)
+    
+    visit_Decl = _visit_statement
+    visit_Assignment = _visit_statement
+    visit_FuncCall = _visit_statement
+    visit_Return = _visit_statement
     
-    def _estimate_loc(self, func_node) -> int:
+    def generic_visit(self, node):
         """
-        Estimate lines of code in a C function.
+        Visit all children of a node using a type-keyed dispatch table.
         
-        This is approximate since pycparser doesn't preserve
-        all formatting information.
+        pycparser's NodeVisitor routes every child through visit(), which
+        looks the handler up by class name on each call. Looking it up by
+        class in _DISPATCH and calling it directly saves that indirection;
+        nodes without a handler are walked recursively.
         
         Args:
-            func_node: The function definition AST node
+            node: The AST node whose children should be visited
             
-        Returns:
-            Estimated lines of code
-            
-        Created: February 1, 2026
+        Created: October 14, 2026
         """
-        # Count the number of statements in the function
-        # This is a rough approximation
-        
-        class StatementCounter(c_ast.NodeVisitor):
-            def __init__(self):
-                self.count = 0
-            
-            def visit_Decl(self, node):
-                self.count += 1
-            
-            def visit_Assignment(self, node):
-                self.count += 1
-            
-            def visit_FuncCall(self, node):
-                self.count += 1
-            
-            def visit_Return(self, node):
-                self.count += 1
-        
-        counter = StatementCounter()
-        counter.visit(func_node)
-        
-        # Return statement count as a proxy for LOC
-        return max(counter.count, 1)
+        dispatch = self._DISPATCH
+        for _, child in node.children():
+            handler = dispatch.get(child.__class__)
+            if handler is None:
+                self.generic_visit(child)
+            else:
+                handler(self, child)
+    
+    # Node class -> visit method, used by generic_visit
+    _DISPATCH = {
+        c_ast.FuncDef: visit_FuncDef,
+        c_ast.If: _visit_branch,
+        c_ast.For: _visit_branch,
+        c_ast.While: _visit_branch,
+        c_ast.DoWhile: _visit_branch,
+        c_ast.Switch: visit_Switch,
+        c_ast.Case: visit_Case,
+        c_ast.BinaryOp: visit_BinaryOp,
+        c_ast.Decl: _visit_statement,
+        c_ast.Assignment: _visit_statement,
+        c_ast.FuncCall: _visit_statement,
+        c_ast.Return: _visit_statement,
+    }
 
 
 def analyze_c_file(filepath: Path) -> List[FunctionMetrics]:
@@ -269,6 +292,7 @@ def analyze_c_file(filepath: Path) -> List[FunctionMetrics]:
         For full C files, you may need to preprocess them first.
         
     Created: February 1, 2026
+    Last Modified: October 14, 2026
     """
     # Read the C source file
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -277,7 +301,7 @@ def analyze_c_file(filepath: Path) -> List[FunctionMetrics]:
     # Parse the C code
     # Note: pycparser expects preprocessed C code
     # For real-world use, you might need to run the C preprocessor first
-    parser = pycparser.CParser()
+    parser = _get_parser()
     
     try:
         ast = parser.parse(source_code, filename=str(filepath))
@@ -292,4 +316,33 @@ def analyze_c_file(filepath: Path) -> List[FunctionMetrics]:
     visitor = CComplexityVisitor()
     visitor.visit(ast)
     
-    return visitor.functions
\ No newline at end of file
+    return visitor.functions
+
+
+def analyze_c_files(
+    paths: List[Path],
+    workers: int | None = None
+) -> Dict[Path, List[FunctionMetrics]]:
+    """
+    Analyze several C files in parallel using a process pool.
+    
+    pycparser is pure Python, so parsing is CPU-bound and benefits from
+    running each file in a separate worker process, via _pool.map_files.
+    
+    Args:
+        paths: List of C files to analyze
+        workers: Number of worker processes (default: os.cpu_count())
+        
+    Returns:
+        Dictionary mapping each path to its list of FunctionMetrics, in the
+        same order as the input paths
+        
+    Raises:
+        ValueError: If workers is less than 1
+        Any exception raised by analyze_c_file for one of the files
+        
+    Created: October 14, 2026
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return dict(zip(paths, _pool.map_files(analyze_c_file, paths, jobs=workers)))
@@ -0,0 +1,203 @@
+"""
+Code Complexity Analyzer - Fast C Scanner
+
+This module provides complexity analysis for C source files using a single
+regex-driven lexical scan instead of a full parse. It only needs to see
+the tokens that affect our metrics (branch keywords, logical operators,
+braces and function headers), so it runs far faster than pycparser and
+works on files that still contain #include and #define directives.
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import List
+
+from .analyzer import FunctionMetrics
+
+
+# One pass over the source picks out everything we care about. Comments,
+# string/char literals and preprocessor directives are matched as whole
+# tokens so keywords inside them are never counted.
+_TOKEN_RE = re.compile(r'''
+      (?P<comment>/\*.*?\*/|//[^\n]*)
+    | (?P<directive>^[ \t]*\#(?:\\\n|[^\n])*)
+    | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+    | (?P<word>[A-Za-z_]\w*)
+    | (?P<logical>&&|\|\|)
+    | (?P<punct>[{}();])
+    | (?P<newline>\n)
+    | (?P<other>\d[\w.]*|[^\s\w])
+''', re.VERBOSE | re.DOTALL | re.MULTILINE)
+
+# Keywords that each add one decision point. 'do' is left out on purpose:
+# every do-while loop ends in a 'while', which is counted instead.
+_BRANCH_KEYWORDS = frozenset({'if', 'for', 'while', 'case'})
+
+# Words that can precede a parenthesis at file scope without naming a
+# function, e.g. in array sizes or attributes
+_NOT_FUNCTION_NAMES = frozenset({
+    'if', 'for', 'while', 'switch', 'return', 'sizeof', 'defined',
+    '__attribute__', '__declspec', '_Alignas', '_Static_assert',
+    'void', 'char', 'short', 'int', 'long', 'float', 'double',
+    'signed', 'unsigned',
+})
+
+
+def analyze_c_source_fast(source: str) -> List[FunctionMetrics]:
+    """
+    Analyze C source code with a lexical scan and return function metrics.
+    
+    A function is recognized as an identifier followed by a parenthesized
+    group and an opening brace at file scope. Inside a function:
+    - Complexity starts at 1 and adds one per if, for, while, case, && and ||
+    - Nesting depth is the deepest brace level below the function body
+    - Lines of code counts lines holding code (not blank, not comment-only)
+      from the function name to its closing brace
+      
+    Args:
+        source: The complete C source code as a string
+        
+    Returns:
+        List of FunctionMetrics objects for all functions found
+        
+    Note:
+        This is a heuristic scanner, not a parser. Unusual declarations
+        (functions returning function pointers, K&R parameter lists) are
+        skipped, and macros are not expanded.
+        
+    Created: October 14, 2026
+    """
+    functions: List[FunctionMetrics] = []
+    
+    # Line numbers holding code, ascending and without duplicates
+    code_lines: List[int] = []
+    
+    line = 1
+    brace_depth = 0
+    paren_depth = 0
+    
+    # File-scope state for spotting function headers
+    previous = None          # (kind, text) of the last file-scope token
+    previous_line = 0        # Line of that token
+    paren_name = None        # (name, line) of the word before an open '('
+    candidate = None         # (name, line) if the last token closed a '(...)'
+    in_linkage_block = 0     # Open 'extern "C" {' blocks, which we look through
+    
+    # State for the function currently being scanned
+    func: FunctionMetrics | None = None
+    
+    for match in _TOKEN_RE.finditer(source):
+        kind = match.lastgroup
+        
+        if kind == 'newline':
+            line += 1
+            continue
+        
+        text = match.group()
+        if kind == 'comment':
+            line += text.count('\n')
+            continue
+        
+        # Everything else is code on this line
+        if not code_lines or code_lines[-1] != line:
+            code_lines.append(line)
+        
+        if kind == 'directive' or kind == 'string':
+            line += text.count('\n')
+            if func is None and brace_depth == 0:
+                previous = (kind, text)
+            continue
+        
+        if func is not None:
+            # Inside a function body: count decision points and braces
+            if kind == 'word':
+                if text in _BRANCH_KEYWORDS:
+                    func.cyclomatic_complexity += 1
+            elif kind == 'logical':
+                func.cyclomatic_complexity += 1
+            elif text == '{':
+                brace_depth += 1
+                if brace_depth - 1 > func.max_nesting_depth:
+                    func.max_nesting_depth = brace_depth - 1
+            elif text == '}':
+                brace_depth -= 1
+                if brace_depth == 0:
+                    start = bisect_left(code_lines, func.lineno)
+                    end = bisect_right(code_lines, line)
+                    func.lines_of_code = end - start
+                    functions.append(func)
+                    func = None
+                    previous = None
+            continue
+        
+        if brace_depth > 0:
+            # Inside a struct, union, enum or initializer at file scope
+            if text == '{':
+                brace_depth += 1
+            elif text == '}':
+                brace_depth -= 1
+            continue
+        
+        # At file scope: look for "name ( ... ) {"
+        if text == '(':
+            if paren_depth == 0:
+                if previous and previous[0] == 'word' and previous[1] not in _NOT_FUNCTION_NAMES:
+                    paren_name = (previous[1], previous_line)
+                else:
+                    paren_name = None
+            paren_depth += 1
+        elif text == ')':
+            if paren_depth > 0:
+                paren_depth -= 1
+                if paren_depth == 0:
+                    candidate = paren_name
+                    previous = (kind, text)
+                    continue
+        elif paren_depth == 0:
+            if text == '{':
+                if candidate is not None and previous == ('punct', ')'):
+                    func = FunctionMetrics(candidate[0], candidate[1])
+                    brace_depth = 1
+                elif previous and previous[0] == 'string':
+                    # extern "C" { ... } only wraps declarations; keep
+                    # treating its contents as file scope
+                    in_linkage_block += 1
+                else:
+                    brace_depth = 1
+            elif text == '}' and in_linkage_block:
+                in_linkage_block -= 1
+        
+        candidate = None
+        previous = (kind, text)
+        previous_line = line
+    
+    return functions
+
+
+def analyze_c_file_fast(filepath: Path) -> List[FunctionMetrics]:
+    """
+    Analyze a C source file for complexity metrics with the fast scanner.
+    
+    Unlike analyze_c_file, this doesn't need pycparser or preprocessed
+    input, so it can be pointed at ordinary C files directly.
+    
+    Args:
+        filepath: Path to the C file to analyze
+        
+    Returns:
+        List of FunctionMetrics objects for all functions in the file
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        UnicodeDecodeError: If the file encoding is not UTF-8
+        
+    Created: October 14, 2026
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        source_code = f.read()
+    
+    return analyze_c_source_fast(source_code)
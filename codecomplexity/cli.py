@@ -6,47 +6,192 @@ It handles argument parsing, user input validation, and output formatting.
 
 Author: Dylan
 Created: January 31, 2026
-Last Modified: February 1, 2026
+Last Modified: October 14, 2026
 """
 
+from __future__ import annotations
+
+import heapq
+import io
+import os
+import stat
 import sys
-import json
-import argparse
-from pathlib import Path
-from typing import List
+import time
+from datetime import datetime
+from operator import attrgetter, itemgetter
+from types import SimpleNamespace
+
+# The analyzers (and pycparser behind them) are only imported by the
+# command that needs them, so --help and argument errors start quickly.
+# argparse is only needed for subcommand help and error messages, and
+# json only for exports. pathlib is among the slowest standard modules to
+# import and --help doesn't need it, so like the names from typing that
+# only appear in annotations it's imported for type checkers alone
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import argparse
+    from pathlib import Path
+    from typing import Dict, List, Tuple
+    from .analyzer import FunctionMetrics
+    from .scanner import ProjectMetrics
+
+
+# Color codes used in all output. They stay empty (plain text) until a
+# command calls _init_colors() and finds that colors should be shown, so
+# the formatters also work when used as a library
+_CYAN = _GREEN = _YELLOW = _RED = _RESET = ''
+_colors_initialized = False
+
+# Whether error messages on stderr may be colored; off when stderr is
+# redirected, even if stdout is a terminal
+_stderr_colors = False
+
+
+def _enable_windows_ansi() -> bool:
+    """
+    Turn on ANSI escape code handling in the Windows console.
+    
+    Windows 10 and later interpret escape codes themselves once virtual
+    terminal processing is enabled on the console handle. Older consoles
+    refuse the mode, and then need colorama to translate the codes.
+    
+    Returns:
+        bool: True if stdout's console now handles escape codes
+        
+    Created: October 14, 2026
+    """
+    import ctypes
+    from ctypes import wintypes
+    
+    kernel32 = ctypes.windll.kernel32
+    
+    def enable(std_handle: int) -> bool:
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING is 0x0004
+        handle = kernel32.GetStdHandle(std_handle)
+        mode = wintypes.DWORD()
+        return bool(kernel32.GetConsoleMode(handle, ctypes.byref(mode)) and
+                    kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    
+    # STD_ERROR_HANDLE (-12) fails harmlessly if stderr is redirected;
+    # only STD_OUTPUT_HANDLE (-11) decides whether colors can be used
+    enable(-12)
+    return enable(-11)
+
+
+def _init_colors() -> None:
+    """
+    Switch on colored output if stdout is a terminal.
+    
+    Colors are left off when output is piped or redirected, or when the
+    NO_COLOR environment variable is set (see https://no-color.org), and
+    the reports then contain no escape codes at all.
+    
+    Terminals on POSIX systems and Windows 10+ get the ANSI codes written
+    directly, with no wrapper around stdout. colorama is only imported on
+    Windows consoles too old for that, and colors stay off there if it
+    isn't installed.
+    
+    Created: October 14, 2026
+    """
+    global _CYAN, _GREEN, _YELLOW, _RED, _RESET
+    global _colors_initialized, _stderr_colors
+    if _colors_initialized:
+        return
+    _colors_initialized = True
+    
+    if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+        return
+    
+    if sys.platform == 'win32' and not _enable_windows_ansi():
+        try:
+            from colorama import just_fix_windows_console
+        except ImportError:
+            return
+        just_fix_windows_console()
+    
+    # Standard ANSI (SGR) codes for the foreground colors and reset
+    _CYAN = '\x1b[36m'
+    _GREEN = '\x1b[32m'
+    _YELLOW = '\x1b[33m'
+    _RED = '\x1b[31m'
+    _RESET = '\x1b[0m'
+    _stderr_colors = sys.stderr.isatty()
+
 
-# Import colorama for cross-platform colored terminal output
-# init() is called to enable color support on Windows
-from colorama import Fore, Style, init
+# Horizontal rules that frame the report sections
+_HR = '=' * 80
+_SEP = '-' * 80
 
-from .analyzer import analyze_python_file, FunctionMetrics
-from .scanner import analyze_directory, ProjectMetrics
+# Minimum time in seconds between progress updates on a terminal
+_PROGRESS_INTERVAL = 0.05
 
-# Try to import C analyzer, but don't fail if pycparser isn't installed
-try:
-    from .c_analyzer import analyze_c_file
-    C_SUPPORT = True
-except ImportError:
-    C_SUPPORT = False
 
-# Initialize colorama for cross-platform color support
-# Created: January 31, 2026
-init(autoreset=True)
+# Top-level help, as argparse prints it for create_parser(). Keep the two in
+# sync when adding a subcommand
+_HELP = """\
+usage: codecomplexity [-h] {analyze,scan} ...
 
+Analyze code complexity metrics for Python and C files
 
-def create_parser() -> argparse.ArgumentParser:
+positional arguments:
+  {analyze,scan}  Command to execute
+    analyze       Analyze a Python or C file for complexity metrics
+    scan          Scan a directory and analyze all Python files
+
+options:
+  -h, --help      show this help message and exit
+
+Example: codecomplexity analyze my_script.py
+"""
+
+
+# Parsers already built by create_parser, by subcommand (None for all)
+_parsers = {}
+
+
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
     """
     Create and configure the command-line argument parser.
     
     This function sets up all the command-line options and arguments
     that users can provide when running the tool.
     
+    Each parser is built once and then reused, so programs that call main()
+    many times (tests, editor integrations) don't redo the add_argument
+    bookkeeping on every call. Callers shouldn't modify the parser.
+    
+    Args:
+        command: If given, only build the arguments for this subcommand.
+                 main() passes the command named on the command line, so
+                 the other subcommands' arguments are never constructed.
+                 
     Returns:
         argparse.ArgumentParser: Configured argument parser
         
     Created: January 31, 2026
-    Last Modified: February 1, 2026
+    Last Modified: October 14, 2026
     """
+    parser = _parsers.get(command)
+    if parser is None:
+        parser = _parsers[command] = _build_parser(command)
+    return parser
+
+
+def _build_parser(command: str | None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser for create_parser.
+    
+    Args:
+        command: Only build the arguments for this subcommand, or None
+                 for all of them. The other subcommands are still listed
+                 
+    Returns:
+        argparse.ArgumentParser: Configured argument parser
+        
+    Created: October 14, 2026
+    """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         prog='codecomplexity',
         description='Analyze code complexity metrics for Python and C files',
@@ -56,12 +201,25 @@ def create_parser() -> argparse.ArgumentParser:
     # Create subcommands (analyze is the main one for now)
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
     
-    # 'analyze' subcommand
-    analyze_parser = subparsers.add_parser(
-        'analyze',
-        help='Analyze a Python or C file for complexity metrics'
-    )
+    # Every subcommand is registered, so usage and help always list all of
+    # them, but only the selected one gets its arguments
+    for name, (help_text, add_arguments) in _SUBPARSER_BUILDERS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if command is None or command == name:
+            add_arguments(subparser)
     
+    return parser
+
+
+def _add_analyze_arguments(analyze_parser) -> None:
+    """
+    Add the arguments of the 'analyze' subcommand.
+    
+    Args:
+        analyze_parser: The subcommand's parser, from add_parser()
+        
+    Created: October 14, 2026
+    """
     # Required argument: the file to analyze
     analyze_parser.add_argument(
         'filepath',
@@ -100,6 +258,13 @@ def create_parser() -> argparse.ArgumentParser:
         help='Only show functions that exceed thresholds'
     )
     
+    analyze_parser.add_argument(
+        '--top',
+        type=int,
+        metavar='N',
+        help='Only show the N most complex functions'
+    )
+    
     # Optional: export results to JSON
     analyze_parser.add_argument(
         '--output',
@@ -108,12 +273,30 @@ def create_parser() -> argparse.ArgumentParser:
         help='Export results to JSON file (e.g., --output results.json)'
     )
     
-    # 'scan' subcommand for analyzing directories
-    scan_parser = subparsers.add_parser(
-        'scan',
-        help='Scan a directory and analyze all Python files'
+    # Optional: pretty-print the JSON export
+    analyze_parser.add_argument(
+        '--indent',
+        type=int,
+        help='Indent the JSON export by this many spaces (default: compact)'
+    )
+    
+    # Optional: use the full C parser instead of the fast scanner
+    analyze_parser.add_argument(
+        '--pycparser',
+        action='store_true',
+        help='Analyze C files with pycparser (requires preprocessed input)'
     )
+
+
+def _add_scan_arguments(scan_parser) -> None:
+    """
+    Add the arguments of the 'scan' subcommand.
     
+    Args:
+        scan_parser: The subcommand's parser, from add_parser()
+        
+    Created: October 14, 2026
+    """
     scan_parser.add_argument(
         'directory',
         type=str,
@@ -154,13 +337,171 @@ def create_parser() -> argparse.ArgumentParser:
         help='Export results to JSON file'
     )
     
+    scan_parser.add_argument(
+        '--indent',
+        type=int,
+        help='Indent the JSON export by this many spaces (default: compact)'
+    )
+    
     scan_parser.add_argument(
         '--include-c',
         action='store_true',
         help='Also analyze C source files (.c and .h)'
     )
     
-    return parser
+    scan_parser.add_argument(
+        '--pycparser',
+        action='store_true',
+        help='Analyze C files with pycparser (requires preprocessed input)'
+    )
+    
+    scan_parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of files to analyze in parallel (default: number of CPUs)'
+    )
+
+
+# Subcommand name -> (help text, function that adds its arguments)
+_SUBPARSER_BUILDERS = {
+    'analyze': ('Analyze a Python or C file for complexity metrics', _add_analyze_arguments),
+    'scan': ('Scan a directory and analyze all Python files', _add_scan_arguments),
+}
+
+# The same options as above, for _parse_args_fast. Each subcommand maps its
+# positional argument's name and every flag to (dest, type, default), where
+# a type of None marks an on/off switch. Keep in sync with the builders
+_COMMON_OPTIONS = {
+    '--complexity-threshold': ('complexity_threshold', int, 10),
+    '--loc-threshold': ('loc_threshold', int, 50),
+    '--nesting-threshold': ('nesting_threshold', int, 4),
+    '--output': ('output', str, None),
+    '-o': ('output', str, None),
+    '--indent': ('indent', int, None),
+    '--pycparser': ('pycparser', None, False),
+}
+_FAST_OPTIONS = {
+    'analyze': ('filepath', {
+        **_COMMON_OPTIONS,
+        '--warnings-only': ('warnings_only', None, False),
+        '--top': ('top', int, None),
+    }),
+    'scan': ('directory', {
+        **_COMMON_OPTIONS,
+        '--no-recursive': ('no_recursive', None, False),
+        '--include-c': ('include_c', None, False),
+        '--jobs': ('jobs', int, os.cpu_count() or 1),
+        '-j': ('jobs', int, os.cpu_count() or 1),
+    }),
+}
+
+
+def _parse_args_fast(argv: List[str]) -> SimpleNamespace | None:
+    """
+    Parse a well-formed command line without argparse.
+    
+    Nearly every run is a plain 'analyze <file>' or 'scan <dir>' with a
+    few flags, which this handles with a single pass over the arguments.
+    Anything else (help, unknown or abbreviated options, missing or
+    invalid values) returns None so that argparse can produce its usual
+    help text or error message.
+    
+    Args:
+        argv: Command-line arguments, not including the program name
+        
+    Returns:
+        SimpleNamespace with the same attributes argparse would set,
+        or None if argparse should handle this command line
+        
+    Created: October 14, 2026
+    """
+    if not argv or argv[0] not in _FAST_OPTIONS:
+        return None
+    positional_name, options = _FAST_OPTIONS[argv[0]]
+    
+    values = {dest: default for dest, _, default in options.values()}
+    values['command'] = argv[0]
+    positional = None
+    
+    index = 1
+    while index < len(argv):
+        arg = argv[index]
+        index += 1
+        
+        if not arg.startswith('-') or arg == '-':
+            # Exactly one positional argument is allowed
+            if positional is not None:
+                return None
+            positional = arg
+            continue
+        
+        # Long options may be written as --name=value
+        name, has_value, value = arg.partition('=') if arg.startswith('--') else (arg, '', '')
+        spec = options.get(name)
+        if spec is None:
+            return None
+        dest, value_type, _ = spec
+        
+        if value_type is None:
+            if has_value:
+                return None
+            values[dest] = True
+            continue
+        
+        if not has_value:
+            # Leave values that look like options to argparse's error handling
+            if index >= len(argv) or argv[index].startswith('-'):
+                return None
+            value = argv[index]
+            index += 1
+        
+        if value_type is int:
+            try:
+                value = int(value)
+            except ValueError:
+                return None
+        values[dest] = value
+    
+    if positional is None:
+        return None
+    values[positional_name] = positional
+    return SimpleNamespace(**values)
+
+
+# Reads a function's complexity; mapped over a list of metrics it builds
+# the complexity column without a Python-level loop
+_get_complexity = attrgetter('cyclomatic_complexity')
+
+
+def threshold_flags(
+    metrics: List[FunctionMetrics],
+    complexity_threshold: int,
+    loc_threshold: int,
+    nesting_threshold: int
+) -> List[Tuple[bool, bool, bool]]:
+    """
+    Check each function against the warning thresholds.
+    
+    Args:
+        metrics: List of FunctionMetrics objects to check
+        complexity_threshold: Complexity level to trigger warnings
+        loc_threshold: Lines of code to trigger warnings
+        nesting_threshold: Nesting depth to trigger warnings
+        
+    Returns:
+        List with one (high complexity, too many lines, too deeply nested)
+        tuple per function, in the same order as metrics
+        
+    Created: October 14, 2026
+    """
+    return [
+        (m.cyclomatic_complexity > complexity_threshold,
+         m.lines_of_code > loc_threshold,
+         m.max_nesting_depth > nesting_threshold)
+        for m in metrics
+    ]
 
 
 def format_metrics_output(
@@ -168,7 +509,10 @@ def format_metrics_output(
     complexity_threshold: int,
     loc_threshold: int,
     nesting_threshold: int,
-    warnings_only: bool = False
+    warnings_only: bool = False,
+    flags: List[Tuple[bool, bool, bool]] | None = None,
+    complexities: List[int] | None = None,
+    top: int | None = None
 ) -> str:
     """
     Format the function metrics into a readable, colorized text report.
@@ -189,141 +533,172 @@ def format_metrics_output(
         loc_threshold: Lines of code to trigger warnings
         nesting_threshold: Nesting depth to trigger warnings
         warnings_only: If True, only show functions exceeding thresholds
-        
+        flags: Optional threshold checks from threshold_flags() for these
+               metrics, if the caller already computed them
+        complexities: Optional list of each function's complexity, in the
+                      same order as metrics, if the caller already has it
+        top: If set, only show this many of the most complex functions.
+             Like warnings_only, this also limits the summary to the
+             functions shown
+             
     Returns:
         str: Formatted, colorized report as a string
         
     Created: January 31, 2026
-    Last Modified: January 31, 2026
+    Last Modified: October 14, 2026
     """
     if not metrics:
         return "No functions found in the file."
     
+    # Check every function against the thresholds once, up front; the
+    # filter, the per-function marks and the warning count all reuse it
+    if flags is None:
+        flags = threshold_flags(metrics, complexity_threshold, loc_threshold, nesting_threshold)
+    if complexities is None:
+        complexities = map(_get_complexity, metrics)
+    # Each row is (complexity, function, flags); with the complexity up
+    # front the rows can be sorted by a C-level itemgetter, and the whole
+    # list is built without running any Python code per function
+    rows = list(zip(complexities, metrics, flags))
+    
     # Filter metrics if warnings_only is set
     if warnings_only:
-        metrics = [
-            m for m in metrics
-            if (m.cyclomatic_complexity > complexity_threshold or
-                m.lines_of_code > loc_threshold or
-                m.max_nesting_depth > nesting_threshold)
-        ]
+        rows = [row for row in rows if any(row[2])]
         
-        if not metrics:
-            return f"{Fore.GREEN}✓ No functions exceed the specified thresholds!"
+        if not rows:
+            return f"{_GREEN}✓ No functions exceed the specified thresholds!"
+    
+    # Colors and separators used on every line, looked up once
+    cyan, green, yellow, red = _CYAN, _GREEN, _YELLOW, _RED
+    reset = _RESET
+    double_rule = cyan + _HR
+    single_rule = cyan + _SEP
+    
+    # Lookup tables indexed by a threshold check (False -> 0, True -> 1)
+    # so each function picks its colors and labels without branching
+    header_styles = (
+        (green, f" {green}✓"),                # Passes all thresholds
+        (yellow, f" {yellow}⚠️  WARNING"),     # Exceeds at least one
+    )
+    metric_marks = (f"{green}[OK]", f"{red}[HIGH]")
     
     # Build the output string
-    lines = []
-    lines.append(f"{Fore.CYAN}{'=' * 80}")
-    lines.append(f"{Fore.CYAN}CODE COMPLEXITY ANALYSIS REPORT")
-    lines.append(f"{Fore.CYAN}{'=' * 80}")
-    lines.append("")
+    buf = io.StringIO()
+    buf.write(f"{double_rule}\n{cyan}CODE COMPLEXITY ANALYSIS REPORT\n{double_rule}\n\n")
     
     # Sort functions by complexity (highest first)
-    sorted_metrics = sorted(
-        metrics,
-        key=lambda m: m.cyclomatic_complexity,
-        reverse=True
-    )
-    
-    for func in sorted_metrics:
-        # Determine if this function has issues
-        has_high_complexity = func.cyclomatic_complexity > complexity_threshold
-        has_many_lines = func.lines_of_code > loc_threshold
-        has_deep_nesting = func.max_nesting_depth > nesting_threshold
-        
+    # A single function is already in order, so skip the sort for it.
+    # When only the top few are shown, a heap picks them out without
+    # sorting the rest; it keeps ties in the same order as the sort
+    if top is not None and top < len(rows):
+        rows = heapq.nlargest(top, rows, key=itemgetter(0))
+    elif len(rows) > 1:
+        rows.sort(key=itemgetter(0), reverse=True)
+    
+    # Summary statistics are gathered in the same pass that formats
+    # each function, instead of walking the list again for each one
+    total_complexity = 0
+    warning_count = 0
+    
+    for complexity, func, (has_high_complexity, has_many_lines, has_deep_nesting) in rows:
         # Determine overall function health
         has_any_issues = has_high_complexity or has_many_lines or has_deep_nesting
         
-        # Add a warning indicator if any threshold is exceeded
-        if has_any_issues:
-            warning = f" {Fore.YELLOW}⚠️  WARNING"
-            func_color = Fore.YELLOW
-        else:
-            warning = f" {Fore.GREEN}✓"
-            func_color = Fore.GREEN
-        
-        # Function header
-        lines.append(f"{func_color}Function: {func.name} (line {func.lineno}){warning}")
-        lines.append(f"{Fore.CYAN}{'-' * 80}")
-        
-        # Cyclomatic Complexity
-        if has_high_complexity:
-            complexity_color = Fore.RED
-            complexity_status = "HIGH"
-        else:
-            complexity_color = Fore.GREEN
-            complexity_status = "OK"
-        
-        lines.append(
-            f"  Cyclomatic Complexity: {func.cyclomatic_complexity} "
-            f"{complexity_color}[{complexity_status}]{Style.RESET_ALL}"
-        )
+        total_complexity += complexity
+        warning_count += has_any_issues
         
-        # Lines of code
-        if has_many_lines:
-            loc_color = Fore.RED
-            loc_status = "HIGH"
-        else:
-            loc_color = Fore.GREEN
-            loc_status = "OK"
-        
-        lines.append(
-            f"  Lines of Code: {func.lines_of_code} "
-            f"{loc_color}[{loc_status}]{Style.RESET_ALL}"
-        )
-        
-        # Nesting depth
-        if has_deep_nesting:
-            nesting_color = Fore.RED
-            nesting_status = "HIGH"
-        else:
-            nesting_color = Fore.GREEN
-            nesting_status = "OK"
+        # Add a warning indicator if any threshold is exceeded
+        func_color, warning = header_styles[has_any_issues]
         
-        lines.append(
-            f"  Max Nesting Depth: {func.max_nesting_depth} "
-            f"{nesting_color}[{nesting_status}]{Style.RESET_ALL}"
+        # Function header, then one line per metric, each marked
+        # red/HIGH if over its threshold, else green/OK
+        buf.write(
+            f"{func_color}Function: {func.name} (line {func.lineno}){warning}\n"
+            f"{single_rule}\n"
+            f"  Cyclomatic Complexity: {complexity} {metric_marks[has_high_complexity]}{reset}\n"
+            f"  Lines of Code: {func.lines_of_code} {metric_marks[has_many_lines]}{reset}\n"
+            f"  Max Nesting Depth: {func.max_nesting_depth} {metric_marks[has_deep_nesting]}{reset}\n"
+            f"\n"
         )
-        
-        lines.append("")
     
     # Summary statistics
-    lines.append(f"{Fore.CYAN}{'=' * 80}")
-    lines.append(f"{Fore.CYAN}SUMMARY")
-    lines.append(f"{Fore.CYAN}{'=' * 80}")
-    lines.append(f"Total Functions Analyzed: {len(metrics)}")
-    
-    avg_complexity = sum(m.cyclomatic_complexity for m in metrics) / len(metrics)
-    lines.append(f"Average Complexity: {avg_complexity:.2f}")
-    
-    max_complexity = max(m.cyclomatic_complexity for m in metrics)
-    lines.append(f"Highest Complexity: {max_complexity}")
-    
-    # Count warnings
-    warning_count = sum(
-        1 for m in metrics
-        if (m.cyclomatic_complexity > complexity_threshold or
-            m.lines_of_code > loc_threshold or
-            m.max_nesting_depth > nesting_threshold)
-    )
+    # The list is sorted by complexity, so the first function is the highest
+    avg_complexity = total_complexity / len(rows)
+    max_complexity = rows[0][0]
     
     if warning_count > 0:
-        warning_color = Fore.YELLOW
+        warning_color = yellow
     else:
-        warning_color = Fore.GREEN
+        warning_color = green
+    
+    buf.write(
+        f"{double_rule}\n"
+        f"{cyan}SUMMARY\n"
+        f"{double_rule}\n"
+        f"Total Functions Analyzed: {len(rows)}\n"
+        f"Average Complexity: {avg_complexity:.2f}\n"
+        f"Highest Complexity: {max_complexity}\n"
+        f"Functions Exceeding Thresholds: {warning_color}{warning_count}{reset}\n"
+        f"{double_rule}"
+    )
     
-    lines.append(f"Functions Exceeding Thresholds: {warning_color}{warning_count}{Style.RESET_ALL}")
+    return buf.getvalue()
+
+
+def file_statistics(
+    project: ProjectMetrics,
+    complexity_threshold: int,
+    loc_threshold: int,
+    nesting_threshold: int
+) -> Dict[Path, Tuple[int, float, int, int]]:
+    """
+    Summarize each file of a project that has functions.
     
-    lines.append(f"{Fore.CYAN}{'=' * 80}")
+    The scan report and the JSON export both need these numbers, so
+    scan_command computes them once here and passes them to both.
     
-    return "\n".join(lines)
+    Args:
+        project: ProjectMetrics object containing all file metrics
+        complexity_threshold: Complexity threshold for warnings
+        loc_threshold: Lines of code threshold for warnings
+        nesting_threshold: Nesting depth threshold for warnings
+        
+    Returns:
+        Dictionary mapping each file path, in the project's order, to
+        (function count, average complexity, highest complexity,
+        number of functions exceeding a threshold)
+        
+    Created: October 14, 2026
+    """
+    file_stats = {}
+    for filepath, metrics in project.file_metrics.items():
+        if metrics:
+            # Total, highest complexity and warnings in a single pass
+            total_complexity = 0
+            max_complexity = 0
+            warning_count = 0
+            for m in metrics:
+                complexity = m.cyclomatic_complexity
+                total_complexity += complexity
+                if complexity > max_complexity:
+                    max_complexity = complexity
+                if (complexity > complexity_threshold or
+                        m.lines_of_code > loc_threshold or
+                        m.max_nesting_depth > nesting_threshold):
+                    warning_count += 1
+            file_stats[filepath] = (
+                len(metrics), total_complexity / len(metrics), max_complexity, warning_count
+            )
+    
+    return file_stats
 
 
 def format_project_output(
     project: ProjectMetrics,
     complexity_threshold: int,
     loc_threshold: int,
-    nesting_threshold: int
+    nesting_threshold: int,
+    file_stats: Dict[Path, Tuple[int, float, int, int]] | None = None
 ) -> str:
     """
     Format project-wide metrics into a readable report.
@@ -336,71 +711,251 @@ def format_project_output(
         complexity_threshold: Complexity threshold for warnings
         loc_threshold: Lines of code threshold for warnings
         nesting_threshold: Nesting depth threshold for warnings
-        
+        file_stats: Optional result of file_statistics() for this project
+                    and these thresholds, if the caller already has it
+                    
     Returns:
         str: Formatted, colorized project report
         
     Created: February 1, 2026
+    Last Modified: October 14, 2026
     """
-    lines = []
-    lines.append(f"{Fore.CYAN}{'=' * 80}")
-    lines.append(f"{Fore.CYAN}PROJECT COMPLEXITY ANALYSIS")
-    lines.append(f"{Fore.CYAN}{'=' * 80}")
-    lines.append("")
+    # Colors and separators used on every line, looked up once
+    cyan = _CYAN
+    reset = _RESET
+    double_rule = cyan + _HR
+    single_rule = cyan + _SEP
+    
+    buf = io.StringIO()
+    buf.write(f"{double_rule}\n{cyan}PROJECT COMPLEXITY ANALYSIS\n{double_rule}\n\n")
     
     # Project-wide summary
-    lines.append(f"{Fore.CYAN}PROJECT SUMMARY")
-    lines.append(f"{Fore.CYAN}{'-' * 80}")
-    lines.append(f"Total Files Analyzed: {project.total_files}")
-    lines.append(f"Total Functions: {project.total_functions}")
-    lines.append(f"Average Complexity: {project.get_average_complexity():.2f}")
-    lines.append(f"Highest Complexity: {project.get_max_complexity()}")
-    lines.append("")
+    buf.write(
+        f"{cyan}PROJECT SUMMARY\n"
+        f"{single_rule}\n"
+        f"Total Files Analyzed: {project.total_files}\n"
+        f"Total Functions: {project.total_functions}\n"
+        f"Average Complexity: {project.get_average_complexity():.2f}\n"
+        f"Highest Complexity: {project.get_max_complexity()}\n"
+        f"\n"
+    )
     
     # Per-file breakdown
-    lines.append(f"{Fore.CYAN}FILE BREAKDOWN")
-    lines.append(f"{Fore.CYAN}{'-' * 80}")
+    buf.write(f"{cyan}FILE BREAKDOWN\n{single_rule}\n")
     
-    # Sort files by average complexity
-    file_stats = []
-    for filepath, metrics in project.file_metrics.items():
-        if metrics:
-            avg_complexity = sum(m.cyclomatic_complexity for m in metrics) / len(metrics)
-            max_complexity = max(m.cyclomatic_complexity for m in metrics)
-            warning_count = sum(
-                1 for m in metrics
-                if (m.cyclomatic_complexity > complexity_threshold or
-                    m.lines_of_code > loc_threshold or
-                    m.max_nesting_depth > nesting_threshold)
-            )
-            file_stats.append((filepath, len(metrics), avg_complexity, max_complexity, warning_count))
+    if file_stats is None:
+        file_stats = file_statistics(project, complexity_threshold, loc_threshold, nesting_threshold)
     
     # Sort by warning count (descending), then by max complexity
-    file_stats.sort(key=lambda x: (x[4], x[3]), reverse=True)
+    file_rows = [(filepath, *stats) for filepath, stats in file_stats.items()]
+    file_rows.sort(key=itemgetter(4, 3), reverse=True)
     
-    for filepath, func_count, avg_complexity, max_complexity, warning_count in file_stats:
+    for filepath, func_count, avg_complexity, max_complexity, warning_count in file_rows:
         # Color code based on warnings
         if warning_count > 0:
-            file_color = Fore.YELLOW
+            file_color = _YELLOW
             status = f"⚠️  {warning_count} warnings"
         else:
-            file_color = Fore.GREEN
+            file_color = _GREEN
             status = "✓ OK"
         
-        lines.append(f"{file_color}{filepath}")
-        lines.append(f"  Functions: {func_count} | Avg Complexity: {avg_complexity:.2f} | "
-                    f"Max: {max_complexity} | {status}{Style.RESET_ALL}")
-        lines.append("")
+        buf.write(
+            f"{file_color}{filepath}\n"
+            f"  Functions: {func_count} | Avg Complexity: {avg_complexity:.2f} | "
+            f"Max: {max_complexity} | {status}{reset}\n"
+            f"\n"
+        )
     
-    lines.append(f"{Fore.CYAN}{'=' * 80}")
+    buf.write(double_rule)
     
-    return "\n".join(lines)
+    return buf.getvalue()
+
+
+def _complexity_summary(metrics: List[FunctionMetrics]) -> tuple:
+    """
+    Compute the average and highest complexity of a list of functions.
+    
+    Both are gathered in one loop instead of separate sum() and max() passes.
+    
+    Args:
+        metrics: List of FunctionMetrics objects
+        
+    Returns:
+        tuple: (average complexity, highest complexity), or (0, 0) if empty
+        
+    Created: October 14, 2026
+    """
+    if not metrics:
+        return 0, 0
+    
+    total_complexity = 0
+    max_complexity = 0
+    for m in metrics:
+        complexity = m.cyclomatic_complexity
+        total_complexity += complexity
+        if complexity > max_complexity:
+            max_complexity = complexity
+    
+    return total_complexity / len(metrics), max_complexity
+
+
+# Separators for compact JSON output (no spaces after ',' and ':')
+_COMPACT_SEPARATORS = (',', ':')
+
+
+def _json_encoder(indent: int | None = None):
+    """
+    Pick the fastest available way to serialize export data to JSON.
+    
+    orjson (the optional 'fast' extra) is used when it's installed and can
+    produce the requested layout: compact, or indented by 2 spaces, which
+    is the only indentation it supports. Otherwise the standard library's
+    encoder is used, built once instead of on every call. Either module is
+    imported here, so runs without --output never load one.
+    
+    Both produce the same bytes for the same layout. In particular the
+    standard encoder is told not to escape non-ASCII characters, since
+    orjson writes names and paths as plain UTF-8; the export format must
+    not depend on whether orjson happens to be installed.
+    
+    Neither can write a string holding lone surrogates as UTF-8. Those
+    come from file names that aren't valid in the filesystem encoding
+    (Python decodes them with surrogateescape), so an object containing
+    one is written with every non-ASCII character as a \\u escape instead,
+    whichever encoder is in use.
+    
+    Args:
+        indent: Spaces per indentation level, or None for compact JSON
+        
+    Returns:
+        A function taking a JSON-serializable object and returning it
+        encoded as UTF-8 JSON bytes
+        
+    Created: October 14, 2026
+    Last Modified: October 14, 2026
+    """
+    if indent is None or indent == 2:
+        try:
+            import orjson
+        except ImportError:
+            pass
+        else:
+            option = orjson.OPT_INDENT_2 if indent == 2 else 0
+            
+            def dumps(obj) -> bytes:
+                try:
+                    return orjson.dumps(obj, option=option)
+                except orjson.JSONEncodeError:
+                    # Raised for surrogates, among other things; anything
+                    # else the fallback can't encode either
+                    return _escaped_json(obj, indent)
+            return dumps
+    
+    from json import JSONEncoder
+    
+    if indent is None:
+        encoder = JSONEncoder(ensure_ascii=False, separators=_COMPACT_SEPARATORS)
+    else:
+        encoder = JSONEncoder(ensure_ascii=False, indent=indent)
+    
+    def dumps(obj) -> bytes:
+        try:
+            return encoder.encode(obj).encode('utf-8')
+        except UnicodeEncodeError:
+            return _escaped_json(obj, indent)
+    return dumps
+
+
+def _escaped_json(obj, indent: int | None) -> bytes:
+    """
+    Serialize an object to JSON with all non-ASCII characters escaped.
+    
+    This is the fallback for strings that can't be encoded as UTF-8,
+    which the standard encoder escapes as \\udcxx like any other character.
+    
+    Args:
+        obj: JSON-serializable object
+        indent: Spaces per indentation level, or None for compact JSON
+        
+    Returns:
+        The JSON text as ASCII bytes
+        
+    Created: October 14, 2026
+    """
+    from json import dumps
+    
+    separators = _COMPACT_SEPARATORS if indent is None else None
+    return dumps(obj, indent=indent, separators=separators).encode('ascii')
+
+
+def _function_records(metrics: List[FunctionMetrics]) -> List[dict]:
+    """
+    Convert function metrics to the dictionaries used in JSON exports.
+    
+    Args:
+        metrics: List of FunctionMetrics objects
+        
+    Returns:
+        List of dictionaries, one per function
+        
+    Created: October 14, 2026
+    """
+    return [
+        {
+            "name": m.name,
+            "line_number": m.lineno,
+            "cyclomatic_complexity": m.cyclomatic_complexity,
+            "lines_of_code": m.lines_of_code,
+            "max_nesting_depth": m.max_nesting_depth
+        }
+        for m in metrics
+    ]
+
+
+def _file_records(
+    project: ProjectMetrics,
+    file_stats: Dict[Path, Tuple[int, float, int, int]] | None = None
+):
+    """
+    Build the JSON export entry for each file with functions in a project.
+    
+    This is a generator so the streaming export can write each entry
+    before building the next one.
+    
+    Args:
+        project: ProjectMetrics object containing all file metrics
+        file_stats: Optional result of file_statistics() for this project,
+                    whose averages and maxima are reused
+                    
+    Yields:
+        One dictionary per file, with its summary and function list
+        
+    Created: October 14, 2026
+    """
+    for filepath, metrics in project.file_metrics.items():
+        if metrics:
+            if file_stats is None:
+                avg_complexity, max_complexity = _complexity_summary(metrics)
+            else:
+                _, avg_complexity, max_complexity, _ = file_stats[filepath]
+            
+            yield {
+                "file": str(filepath),
+                "summary": {
+                    "total_functions": len(metrics),
+                    "average_complexity": round(avg_complexity, 2),
+                    "highest_complexity": max_complexity
+                },
+                "functions": _function_records(metrics)
+            }
 
 
 def export_to_json(
     metrics: List[FunctionMetrics],
     filepath: Path,
-    output_file: str
+    output_file: str,
+    indent: int | None = None,
+    complexities: List[int] | None = None
 ) -> None:
     """
     Export function metrics to a JSON file.
@@ -420,44 +975,48 @@ def export_to_json(
         metrics: List of FunctionMetrics objects to export
         filepath: Path to the analyzed file
         output_file: Path where JSON should be written
-        
+        indent: Pretty-print with this many spaces per level; by default
+                the JSON is written compactly, for machine consumers
+        complexities: Optional list of each function's complexity, in the
+                      same order as metrics, if the caller already has it
+                      
     Created: January 31, 2026
+    Last Modified: October 14, 2026
     """
-    # Calculate summary statistics
-    avg_complexity = sum(m.cyclomatic_complexity for m in metrics) / len(metrics) if metrics else 0
-    max_complexity = max((m.cyclomatic_complexity for m in metrics), default=0)
+    # Calculate summary statistics, with C-level sum() and max() when the
+    # complexity column is already available
+    if complexities is None:
+        avg_complexity, max_complexity = _complexity_summary(metrics)
+    elif complexities:
+        avg_complexity = sum(complexities) / len(complexities)
+        max_complexity = max(complexities)
+    else:
+        avg_complexity, max_complexity = 0, 0
     
     # Build the JSON structure
     data = {
         "file": str(filepath),
-        "timestamp": __import__('datetime').datetime.now().isoformat(),
+        "timestamp": datetime.now().isoformat(),
         "summary": {
             "total_functions": len(metrics),
             "average_complexity": round(avg_complexity, 2),
             "highest_complexity": max_complexity
         },
-        "functions": [
-            {
-                "name": m.name,
-                "line_number": m.lineno,
-                "cyclomatic_complexity": m.cyclomatic_complexity,
-                "lines_of_code": m.lines_of_code,
-                "max_nesting_depth": m.max_nesting_depth
-            }
-            for m in metrics
-        ]
+        "functions": _function_records(metrics)
     }
     
-    # Write to file with nice formatting
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    # Write to file, compact unless pretty-printing was asked for
+    contents = _json_encoder(indent)(data)
+    _replace_file(output_file, lambda f: f.write(contents))
     
-    print(f"{Fore.GREEN}✓ Results exported to {output_file}{Style.RESET_ALL}")
+    print(f"{_GREEN}✓ Results exported to {output_file}{_RESET}")
 
 
 def export_project_to_json(
     project: ProjectMetrics,
-    output_file: str
+    output_file: str,
+    indent: int | None = None,
+    file_stats: Dict[Path, Tuple[int, float, int, int]] | None = None
 ) -> None:
     """
     Export project-wide metrics to a JSON file.
@@ -465,15 +1024,25 @@ def export_project_to_json(
     This function exports all metrics for a scanned project directory
     into a structured JSON format.
     
+    By default the JSON is compact and streamed: the header is written
+    first and each file's entry is serialized and written as soon as it's
+    built, so the whole document never has to exist in memory at once.
+    Pretty-printing (indent) builds the full structure and dumps it.
+    
     Args:
         project: ProjectMetrics object containing all file metrics
         output_file: Path where JSON should be written
-        
+        indent: Pretty-print with this many spaces per level; by default
+                the JSON is written compactly, for machine consumers
+        file_stats: Optional result of file_statistics() for this project,
+                    so the per-file summaries aren't computed again
+                    
     Created: February 1, 2026
+    Last Modified: October 14, 2026
     """
     # Build the JSON structure
     data = {
-        "timestamp": __import__('datetime').datetime.now().isoformat(),
+        "timestamp": datetime.now().isoformat(),
         "summary": {
             "total_files": project.total_files,
             "total_functions": project.total_functions,
@@ -483,37 +1052,132 @@ def export_project_to_json(
         "files": []
     }
     
-    # Add each file's metrics
-    for filepath, metrics in project.file_metrics.items():
-        if metrics:
-            avg_complexity = sum(m.cyclomatic_complexity for m in metrics) / len(metrics)
-            max_complexity = max(m.cyclomatic_complexity for m in metrics)
-            
-            file_data = {
-                "file": str(filepath),
-                "summary": {
-                    "total_functions": len(metrics),
-                    "average_complexity": round(avg_complexity, 2),
-                    "highest_complexity": max_complexity
-                },
-                "functions": [
-                    {
-                        "name": m.name,
-                        "line_number": m.lineno,
-                        "cyclomatic_complexity": m.cyclomatic_complexity,
-                        "lines_of_code": m.lines_of_code,
-                        "max_nesting_depth": m.max_nesting_depth
-                    }
-                    for m in metrics
-                ]
-            }
-            data["files"].append(file_data)
+    dumps = _json_encoder(indent)
     
-    # Write to file with nice formatting
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    def write_json(f) -> None:
+        if indent is not None:
+            data["files"] = list(_file_records(project, file_stats))
+            f.write(dumps(data))
+            return
+        
+        # Everything up to the files list, without its closing "]}"
+        header = dumps(data)
+        f.write(header[:-2])
+        
+        separator = b""
+        for file_data in _file_records(project, file_stats):
+            f.write(separator)
+            f.write(dumps(file_data))
+            separator = b","
+        
+        f.write(b"]}")
+    
+    # A large buffer keeps the many small writes above from each
+    # turning into a system call
+    _replace_file(output_file, write_json, buffering=1 << 20)
+    
+    print(f"{_GREEN}✓ Project results exported to {output_file}{_RESET}")
+
+
+def _replace_file(output_file: str, write, buffering: int = -1) -> None:
+    """
+    Write a file through a temporary file, then move it into place.
     
-    print(f"{Fore.GREEN}✓ Project results exported to {output_file}{Style.RESET_ALL}")
+    The contents go to a temporary file in the same directory, which is
+    renamed over output_file only once writing has finished. An error
+    part-way through (e.g. while encoding a streamed export) then leaves
+    any previous file untouched instead of a truncated one, and the
+    temporary file is removed.
+    
+    Args:
+        output_file: Path of the file to create or replace
+        write: Function called with the open binary file to write to
+        buffering: Buffer size passed to the file object
+        
+    Created: October 14, 2026
+    """
+    import tempfile
+    
+    # Replace the file a symlink points at, not the symlink
+    target = os.path.realpath(output_file)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.tmp-', suffix='.json')
+    except OSError as e:
+        # Report the file that was asked for, not the temporary name
+        raise OSError(e.errno, e.strerror, output_file) from None
+    try:
+        with os.fdopen(fd, 'wb', buffering) as f:
+            write(f)
+        # mkstemp creates the file readable by its owner only; give it the
+        # permissions open() would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, target)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _write_report(report: str) -> None:
+    """
+    Write a finished report to stdout in one go.
+    
+    print() converts its argument and looks up sys.stdout's write method
+    on every call; here the report goes out as one write, followed by a
+    color reset (the reports end in a color) and the newline, and stdout
+    is flushed once at the end.
+    
+    Args:
+        report: The formatted report text, without a trailing newline
+        
+    Created: October 14, 2026
+    """
+    write = sys.stdout.write
+    write(report)
+    write(_RESET)
+    write("\n")
+    sys.stdout.flush()
+
+
+def _error(message: str, color: str | None = None) -> None:
+    """
+    Write an error or warning line to stderr.
+    
+    Every error path in the commands goes through here, so a message is
+    always two plain writes instead of a print() call. sys.stderr is
+    looked up each time rather than cached at import time, so it follows
+    any replacement (such as output capture in tests). The message is
+    only colored if stderr is a terminal, so redirected logs stay plain.
+    
+    Args:
+        message: The message, including its "Error:" or "Warning:" prefix
+        color: Color code to show it in (default: red)
+        
+    Created: October 14, 2026
+    """
+    write = sys.stderr.write
+    if _stderr_colors:
+        write(f"{_RED if color is None else color}{message}{_RESET}")
+    else:
+        write(message)
+    write("\n")
+
+
+def _has_pycparser() -> bool:
+    """
+    Check whether the pycparser-based C analyzer can be imported.
+    
+    Returns:
+        bool: True if pycparser is installed
+        
+    Created: October 14, 2026
+    """
+    try:
+        from . import c_analyzer
+    except ImportError:
+        return False
+    return True
 
 
 def analyze_command(args: argparse.Namespace) -> int:
@@ -530,19 +1194,33 @@ def analyze_command(args: argparse.Namespace) -> int:
         int: Exit code (0 for success, 1 for error)
         
     Created: January 31, 2026
-    Last Modified: February 1, 2026
+    Last Modified: October 14, 2026
     """
+    _init_colors()
+    from pathlib import Path
+    
     # Convert the filepath string to a Path object
     filepath = Path(args.filepath)
     
-    # Validate that the file exists
-    if not filepath.exists():
-        print(f"{Fore.RED}Error: File '{filepath}' not found.{Style.RESET_ALL}", file=sys.stderr)
+    # Validate that the file exists and is actually a file (not a
+    # directory), with a single stat call for both checks
+    try:
+        st = os.stat(filepath)
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        # ValueError: the path contains a NUL byte, so can't exist
+        _error(f"Error: File '{filepath}' not found.")
+        return 1
+    except OSError as e:
+        # E.g. a symlink loop or a parent directory we can't search
+        _error(f"Error: Cannot access '{filepath}': {e.strerror}.")
         return 1
     
-    # Validate that it's actually a file (not a directory)
-    if not filepath.is_file():
-        print(f"{Fore.RED}Error: '{filepath}' is not a file.{Style.RESET_ALL}", file=sys.stderr)
+    if not stat.S_ISREG(st.st_mode):
+        _error(f"Error: '{filepath}' is not a file.")
+        return 1
+    
+    if args.top is not None and args.top < 1:
+        _error("Error: --top must be at least 1.")
         return 1
     
     # Determine file type and validate
@@ -550,27 +1228,49 @@ def analyze_command(args: argparse.Namespace) -> int:
     is_c = filepath.suffix in ['.c', '.h']
     
     if not is_python and not is_c:
-        print(f"{Fore.YELLOW}Warning: '{filepath}' doesn't have a .py, .c, or .h extension.{Style.RESET_ALL}", file=sys.stderr)
-        print("Attempting to analyze as Python anyway...", file=sys.stderr)
+        _error(f"Warning: '{filepath}' doesn't have a .py, .c, or .h extension.", _YELLOW)
+        sys.stderr.write("Attempting to analyze as Python anyway...\n")
         is_python = True
     
-    # Check if C support is available
-    if is_c and not C_SUPPORT:
-        print(f"{Fore.RED}Error: C support requires pycparser. Install with: uv add pycparser{Style.RESET_ALL}", file=sys.stderr)
-        return 1
+    # Load only the analyzer this file needs
+    if is_python:
+        from .analyzer import analyze_python_file
+    elif args.pycparser:
+        # Don't fail at startup if pycparser isn't installed
+        try:
+            from .c_analyzer import analyze_c_file
+        except ImportError:
+            _error("Error: --pycparser requires pycparser. Install with: uv add pycparser")
+            return 1
+    else:
+        from .c_analyzer_fast import analyze_c_file_fast
     
     try:
         # Run the analysis
-        print(f"{Fore.CYAN}Analyzing {filepath}...{Style.RESET_ALL}\n")
+        print(f"{_CYAN}Analyzing {filepath}...{_RESET}\n")
         
         if is_python:
             metrics = analyze_python_file(filepath)
-        else:  # is_c
+        elif args.pycparser:
             metrics = analyze_c_file(filepath)
+        else:  # is_c
+            metrics = analyze_c_file_fast(filepath)
+        
+        # The export and the report both need every function's complexity,
+        # so build that column once and hand it to both
+        complexities = list(map(_get_complexity, metrics))
         
         # If JSON output requested, export to file
         if args.output:
-            export_to_json(metrics, filepath, args.output)
+            export_to_json(metrics, filepath, args.output, args.indent, complexities)
+        
+        # Check the thresholds once for everything that reports on them
+        flags = threshold_flags(
+            metrics,
+            args.complexity_threshold,
+            args.loc_threshold,
+            args.nesting_threshold
+        )
         
         # Always show the terminal output
         output = format_metrics_output(
@@ -578,17 +1278,20 @@ def analyze_command(args: argparse.Namespace) -> int:
             args.complexity_threshold,
             args.loc_threshold,
             args.nesting_threshold,
-            args.warnings_only
+            args.warnings_only,
+            flags,
+            complexities,
+            args.top
         )
-        print(output)
+        _write_report(output)
         
         return 0
-        
+    
     except SyntaxError as e:
-        print(f"{Fore.RED}Error: Syntax error in file: {e}{Style.RESET_ALL}", file=sys.stderr)
+        _error(f"Error: Syntax error in file: {e}")
         return 1
     except Exception as e:
-        print(f"{Fore.RED}Error: Failed to analyze file: {e}{Style.RESET_ALL}", file=sys.stderr)
+        _error(f"Error: Failed to analyze file: {e}")
         return 1
 
 
@@ -606,62 +1309,112 @@ def scan_command(args: argparse.Namespace) -> int:
         int: Exit code (0 for success, 1 for error)
         
     Created: February 1, 2026
+    Last Modified: October 14, 2026
     """
+    _init_colors()
+    from pathlib import Path
+    from .scanner import analyze_directory
+    
     # Convert the directory string to a Path object
     directory = Path(args.directory)
     
-    # Validate that the directory exists
-    if not directory.exists():
-        print(f"{Fore.RED}Error: Directory '{directory}' not found.{Style.RESET_ALL}", file=sys.stderr)
+    # Validate that the directory exists and is actually a directory,
+    # with a single stat call for both checks
+    try:
+        st = os.stat(directory)
+    except (FileNotFoundError, NotADirectoryError, ValueError):
+        # ValueError: the path contains a NUL byte, so can't exist
+        _error(f"Error: Directory '{directory}' not found.")
+        return 1
+    except OSError as e:
+        # E.g. a symlink loop or a parent directory we can't search
+        _error(f"Error: Cannot access '{directory}': {e.strerror}.")
         return 1
     
-    # Validate that it's actually a directory
-    if not directory.is_dir():
-        print(f"{Fore.RED}Error: '{directory}' is not a directory.{Style.RESET_ALL}", file=sys.stderr)
+    if not stat.S_ISDIR(st.st_mode):
+        _error(f"Error: '{directory}' is not a directory.")
         return 1
     
-    # Check if C support is requested but not available
-    if args.include_c and not C_SUPPORT:
-        print(f"{Fore.YELLOW}Warning: C support requires pycparser. Install with: uv add pycparser{Style.RESET_ALL}", file=sys.stderr)
-        print(f"{Fore.YELLOW}Continuing with Python files only...{Style.RESET_ALL}\n", file=sys.stderr)
-        args.include_c = False
+    if args.jobs < 1:
+        _error("Error: --jobs must be at least 1.")
+        return 1
+    
+    # Fall back to the fast C scanner if pycparser is requested but not available
+    if args.include_c and args.pycparser and not _has_pycparser():
+        _error("Warning: --pycparser requires pycparser. Install with: uv add pycparser", _YELLOW)
+        _error("Continuing with the fast C scanner...\n", _YELLOW)
+        args.pycparser = False
     
     try:
         # Determine if we should recurse
         recursive = not args.no_recursive
         
-        # Progress callback to show which file we're analyzing
-        def show_progress(filepath: Path, total: int, current: int):
-            print(f"{Fore.CYAN}[{current}/{total}] Analyzing {filepath}...{Style.RESET_ALL}")
+        # Progress callback to show which file we're analyzing. On a
+        # terminal this redraws a single line at most 20 times a second
+        # (plus the final file), since printing a line per file can take
+        # longer than the analysis itself on big trees. Redirected output
+        # keeps one line per file so logs show every file. Parallel runs
+        # report each file as it finishes rather than as it starts
+        verb, ellipsis = ("Analyzed", "") if args.jobs > 1 else ("Analyzing", "...")
         
-        # Run the analysis
-        print(f"{Fore.CYAN}Scanning directory: {directory}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Recursive: {recursive}{Style.RESET_ALL}")
+        if sys.stdout.isatty():
+            last_update = 0.0
+            
+            def show_progress(filepath: Path, total: int, current: int):
+                nonlocal last_update
+                now = time.monotonic()
+                if current != total and now - last_update < _PROGRESS_INTERVAL:
+                    return
+                last_update = now
+                sys.stdout.write(f"\r{_CYAN}[{current}/{total}] {verb} {filepath}{ellipsis}{_RESET}\x1b[K")
+                if current == total:
+                    sys.stdout.write("\n")
+                sys.stdout.flush()
+        else:
+            write = sys.stdout.write
+            
+            def show_progress(filepath: Path, total: int, current: int):
+                write(f"{_CYAN}[{current}/{total}] {verb} {filepath}{ellipsis}{_RESET}\n")
+        
+        # Run the analysis, after the settings in a single write
+        header = f"{_CYAN}Scanning directory: {directory}{_RESET}\n{_CYAN}Recursive: {recursive}{_RESET}\n"
         if args.include_c:
-            print(f"{Fore.CYAN}Including C files: Yes{Style.RESET_ALL}")
-        print("")
+            header += f"{_CYAN}Including C files: Yes{_RESET}\n"
+        sys.stdout.write(header + "\n")
         
-        project = analyze_directory(directory, recursive, args.include_c, show_progress)
+        project = analyze_directory(
+            directory, recursive, args.include_c, show_progress,
+            use_pycparser=args.pycparser, jobs=args.jobs
+        )
         
         print("")  # Blank line after progress
         
+        # Summarize each file once for both the export and the report
+        file_stats = file_statistics(
+            project,
+            args.complexity_threshold,
+            args.loc_threshold,
+            args.nesting_threshold
+        )
+        
         # If JSON output requested, export to file
         if args.output:
-            export_project_to_json(project, args.output)
+            export_project_to_json(project, args.output, args.indent, file_stats)
         
         # Show the terminal output
         output = format_project_output(
             project,
             args.complexity_threshold,
             args.loc_threshold,
-            args.nesting_threshold
+            args.nesting_threshold,
+            file_stats
         )
-        print(output)
+        _write_report(output)
         
         return 0
-        
+    
     except Exception as e:
-        print(f"{Fore.RED}Error: Failed to scan directory: {e}{Style.RESET_ALL}", file=sys.stderr)
+        _error(f"Error: Failed to scan directory: {e}")
         return 1
 
 
@@ -676,14 +1429,29 @@ def main() -> int:
         int: Exit code to return to the operating system
         
     Created: January 31, 2026
-    Last Modified: February 1, 2026
+    Last Modified: October 14, 2026
     """
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    
+    # Top-level help doesn't need a parser at all. This is the text
+    # argparse would print, so no subcommand has to be built for it
+    if not argv or argv[0] in ('-h', '--help'):
+        sys.stdout.write(_HELP)
+        return 0 if argv else 1
+    
+    # Plain command lines are parsed directly; argparse is only loaded
+    # for subcommand help and to report errors
+    args = _parse_args_fast(argv)
+    if args is None:
+        # Only build the subcommand that was asked for. Anything else gets
+        # the full parser so it can report the error with the usual message
+        command = argv[0] if argv[0] in _SUBPARSER_BUILDERS else None
+        parser = create_parser(command)
+        args = parser.parse_args(argv)
     
     # If no command was specified, show help
     if not args.command:
-        parser.print_help()
+        sys.stdout.write(_HELP)
         return 1
     
     # Dispatch to the appropriate command handler
@@ -693,7 +1461,8 @@ def main() -> int:
         return scan_command(args)
     
     # This shouldn't happen, but just in case
-    print(f"{Fore.RED}Error: Unknown command '{args.command}'{Style.RESET_ALL}", file=sys.stderr)
+    _init_colors()
+    _error(f"Error: Unknown command '{args.command}'")
     return 1
 
 
@@ -6,13 +6,50 @@ multiple Python and C files in a project.
 
 Author: Dylan
 Created: February 1, 2026
-Last Modified: February 1, 2026
+Last Modified: October 14, 2026
 """
 
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict
-from .analyzer import analyze_python_file, FunctionMetrics
-from .c_analyzer import analyze_c_file
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Tuple
+from . import _cache, _pool
+from .analyzer import (
+    analyze_python_file, analyze_python_source, FunctionMetrics,
+    _map_source, _metrics_from_tuple, _metrics_to_tuple, _read_source, _MMAP_THRESHOLD
+)
+from .c_analyzer_fast import analyze_c_file_fast
+
+
+# Directories to skip during scanning
+# These typically contain generated code or dependencies
+_SKIP_DIRS = frozenset({
+    '.venv', 'venv', 'env', 'ENV',
+    '__pycache__',
+    '.git',
+    'node_modules',
+    '.tox',
+    '.pytest_cache',
+    'build',
+    'dist',
+    '.eggs',
+})
+
+# Directory name endings to skip, e.g. mypackage.egg-info
+_SKIP_SUFFIXES = ('.egg-info',)
+
+# Reader threads for a serial scan, and how many files they may read ahead
+# of the one being parsed; the window bounds the bytes held in memory
+_PREFETCH_THREADS = 4
+_PREFETCH_WINDOW = 16
+
+# File name endings for each kind of source file
+_PYTHON_SUFFIXES = ('.py',)
+_PYTHON_AND_C_SUFFIXES = ('.py', '.c', '.h')
 
 
 class ProjectMetrics:
@@ -22,12 +59,18 @@ class ProjectMetrics:
     This class holds metrics for all files in a project, providing
     both file-level and project-level statistics.
     
+    The totals are kept up to date by add_file, so everything is read-only
+    from outside: file_metrics is a read-only view holding a tuple of
+    metrics per file, and adding a file again replaces its earlier metrics
+    instead of counting them twice.
+    
     Attributes:
-        file_metrics: Dictionary mapping file paths to their function metrics
+        file_metrics: Read-only mapping of file paths to their function metrics
         total_files: Total number of source files analyzed
         total_functions: Total number of functions across all files
         
     Created: February 1, 2026
+    Last Modified: October 14, 2026
     """
     
     def __init__(self):
@@ -35,24 +78,97 @@ class ProjectMetrics:
         Initialize an empty ProjectMetrics object.
         
         Created: February 1, 2026
+        Last Modified: October 14, 2026
+        """
+        self._file_metrics: Dict[Path, Tuple[FunctionMetrics, ...]] = {}
+        self._total_files = 0
+        self._total_functions = 0
+        
+        # Running totals kept by add_file, so the project-wide average and
+        # maximum are available without another pass over every function
+        self._total_complexity = 0
+        self._max_complexity = 0
+    
+    @property
+    def file_metrics(self) -> Mapping[Path, Tuple[FunctionMetrics, ...]]:
+        """
+        Read-only view of each stored file's metrics, in the order added.
+        
+        The view is made on each access, so the project itself can still
+        be pickled and copied.
+        
+        Created: October 14, 2026
+        """
+        return MappingProxyType(self._file_metrics)
+    
+    @property
+    def total_files(self) -> int:
+        """
+        Number of files added, including those not stored.
+        
+        Created: October 14, 2026
+        """
+        return self._total_files
+    
+    @property
+    def total_functions(self) -> int:
+        """
+        Number of functions across all files added.
+        
+        Created: October 14, 2026
         """
-        self.file_metrics: Dict[Path, List[FunctionMetrics]] = {}
-        self.total_files = 0
-        self.total_functions = 0
+        return self._total_functions
     
-    def add_file(self, filepath: Path, metrics: List[FunctionMetrics]) -> None:
+    def add_file(self, filepath: Path, metrics: List[FunctionMetrics], store: bool = True) -> None:
         """
         Add metrics for a single file to the project.
         
         Args:
             filepath: Path to the analyzed file
             metrics: List of function metrics from that file
-            
+            store: If False, only update the project totals and don't keep
+                   the metrics in file_metrics (for streaming scans). Files
+                   that aren't stored can't be recognized when they're
+                   added again, so each must only be added once
+                   
         Created: February 1, 2026
+        Last Modified: October 14, 2026
         """
-        self.file_metrics[filepath] = metrics
-        self.total_files += 1
-        self.total_functions += len(metrics)
+        replaced = self._file_metrics.pop(filepath, None) if store else None
+        if replaced is not None:
+            self._remove_totals(replaced)
+        if store:
+            self._file_metrics[filepath] = tuple(metrics)
+        self._total_files += 1
+        self._total_functions += len(metrics)
+        
+        # Accumulate in locals, then store once
+        total_complexity = self._total_complexity
+        max_complexity = self._max_complexity
+        for m in metrics:
+            complexity = m.cyclomatic_complexity
+            total_complexity += complexity
+            if complexity > max_complexity:
+                max_complexity = complexity
+        self._total_complexity = total_complexity
+        self._max_complexity = max_complexity
+    
+    def _remove_totals(self, metrics: Tuple[FunctionMetrics, ...]) -> None:
+        """
+        Take a replaced file's metrics back out of the running totals.
+        
+        The maximum can't be undone incrementally, so it's recomputed from
+        what's left. That only happens when a file is added twice.
+        
+        Created: October 14, 2026
+        """
+        self._total_files -= 1
+        self._total_functions -= len(metrics)
+        self._total_complexity -= sum(map(attrgetter('cyclomatic_complexity'), metrics))
+        self._max_complexity = max(
+            map(attrgetter('cyclomatic_complexity'), chain.from_iterable(self._file_metrics.values())),
+            default=0
+        )
     
     def get_all_functions(self) -> List[FunctionMetrics]:
         """
@@ -62,11 +178,10 @@ class ProjectMetrics:
             List of all FunctionMetrics objects from all files
             
         Created: February 1, 2026
+        Last Modified: October 14, 2026
         """
-        all_functions = []
-        for metrics in self.file_metrics.values():
-            all_functions.extend(metrics)
-        return all_functions
+        # chain runs the loop over the files in C
+        return list(chain.from_iterable(self.file_metrics.values()))
     
     def get_average_complexity(self) -> float:
         """
@@ -76,13 +191,12 @@ class ProjectMetrics:
             Average complexity as a float, or 0 if no functions found
             
         Created: February 1, 2026
+        Last Modified: October 14, 2026
         """
-        all_functions = self.get_all_functions()
-        if not all_functions:
+        if not self.total_functions:
             return 0.0
         
-        total_complexity = sum(f.cyclomatic_complexity for f in all_functions)
-        return total_complexity / len(all_functions)
+        return self._total_complexity / self.total_functions
     
     def get_max_complexity(self) -> int:
         """
@@ -92,12 +206,9 @@ class ProjectMetrics:
             Maximum complexity value, or 0 if no functions found
             
         Created: February 1, 2026
+        Last Modified: October 14, 2026
         """
-        all_functions = self.get_all_functions()
-        if not all_functions:
-            return 0
-        
-        return max(f.cyclomatic_complexity for f in all_functions)
+        return self._max_complexity
 
 
 def find_source_files(directory: Path, recursive: bool = True, include_c: bool = False) -> List[Path]:
@@ -122,53 +233,259 @@ def find_source_files(directory: Path, recursive: bool = True, include_c: bool =
     - .git (version control)
     - node_modules (Node.js dependencies)
     - .tox, .pytest_cache (testing artifacts)
+    - build, dist, .eggs, *.egg-info (packaging output)
     
     Created: February 1, 2026
-    Last Modified: February 1, 2026
-    """
-    # Directories to skip during scanning
-    # These typically contain generated code or dependencies
-    skip_dirs = {
-        '.venv', 'venv', 'env', 'ENV',
-        '__pycache__',
-        '.git',
-        'node_modules',
-        '.tox',
-        '.pytest_cache',
-        'build',
-        'dist',
-        '.eggs',
-        '*.egg-info'
-    }
-    
-    source_files = []
-    
+    Last Modified: October 14, 2026
+    """
     # Define which extensions to search for
-    extensions = ['*.py']
-    if include_c:
-        extensions.extend(['*.c', '*.h'])
-    
-    if recursive:
-        # Recursively find all source files
-        for ext in extensions:
-            for path in directory.rglob(ext):
-                # Check if any parent directory is in skip_dirs
-                if not any(part in skip_dirs for part in path.parts):
-                    source_files.append(path)
-    else:
-        # Only check the immediate directory
-        for ext in extensions:
-            for path in directory.glob(ext):
-                source_files.append(path)
-    
-    return sorted(source_files)
+    suffixes = _PYTHON_AND_C_SUFFIXES if include_c else _PYTHON_SUFFIXES
+    
+    # Sort the strings before wrapping them, on the same key Path ordering
+    # uses (its parts, case-folded where the OS is case-insensitive), so the
+    # order is unchanged but no PurePath.__lt__ call is made per comparison
+    source_files = sorted(_walk_source_files(os.fspath(directory), suffixes, recursive),
+                          key=_path_sort_key)
+    
+    return list(map(Path, source_files))
+
+
+def _path_sort_key(path: str) -> List[str]:
+    """
+    Return a sort key for a path string that orders the same as Path.
+    
+    A plain string sort would put 'a-b/x.py' before 'a/x.py', because '-'
+    sorts before the separator; comparing the split parts doesn't.
+    
+    Created: October 14, 2026
+    """
+    return os.path.normcase(path).split(os.sep)
+
+
+def _walk_source_files(directory: str, suffixes: Tuple[str, ...], recursive: bool) -> Iterator[str]:
+    """
+    Yield the paths of source files under a directory.
+    
+    The tree is walked with os.scandir, whose entries already know from
+    the directory listing whether they're files or directories, so no
+    extra stat() call is needed per entry. Excluded directories are
+    dropped before they're opened, so nothing inside a large .venv or
+    node_modules is ever listed. Like Path.rglob, symlinked directories
+    are not followed and unreadable directories are skipped.
+    
+    Args:
+        directory: Directory to scan
+        suffixes: File name endings to look for, e.g. ('.py',)
+        recursive: If True, also walk subdirectories
+        
+    Yields:
+        Path strings of the matching files, in no particular order
+        
+    Created: October 14, 2026
+    """
+    pending = [directory]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except PermissionError:
+            continue
+        
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if (recursive and name not in _SKIP_DIRS and
+                            not name.endswith(_SKIP_SUFFIXES)):
+                        pending.append(entry.path)
+                elif name.endswith(suffixes) and entry.is_file():
+                    yield entry.path
+
+
+def find_python_files(directory: Path, recursive: bool = True) -> List[Path]:
+    """
+    Find all Python source files in a directory.
+    
+    This is find_source_files without C files, for callers that only hand
+    Python files to analyze_python_file.
+    
+    Args:
+        directory: Path to the directory to scan
+        recursive: If True, scan subdirectories recursively
+        
+    Returns:
+        Sorted list of Path objects pointing to Python files
+        
+    Created: October 14, 2026
+    """
+    return find_source_files(directory, recursive, include_c=False)
+
+
+def analyze_source_file(filepath: Path, use_pycparser: bool = False) -> List[FunctionMetrics] | None:
+    """
+    Analyze one Python or C source file, picking the analyzer by suffix.
+    
+    This is a module-level function so it can be handed to a process pool.
+    
+    Args:
+        filepath: Path to the source file
+        use_pycparser: If True, analyze C files with the full pycparser-based
+                       analyzer instead of the fast lexical scanner
+                       
+    Returns:
+        List of FunctionMetrics objects, or None if the file is neither
+        Python nor C
+        
+    Raises:
+        Any exception raised by the analyzer, e.g. SyntaxError
+        
+    Created: October 14, 2026
+    """
+    suffix = filepath.suffix
+    if suffix == '.py':
+        return analyze_python_file(filepath)
+    if suffix == '.c' or suffix == '.h':
+        if use_pycparser:
+            from .c_analyzer import analyze_c_file
+            return analyze_c_file(filepath)
+        return analyze_c_file_fast(filepath)
+    return None
+
+
+def _analyze_one(
+    filepath: Path,
+    use_pycparser: bool = False,
+    prefetched: Future | None = None
+) -> List[FunctionMetrics] | None:
+    """
+    Analyze one source file for analyze_directory, skipping failures.
+    
+    Results are looked up in the persistent cache by the file's path,
+    modification time and size first, so unchanged files in a re-scanned
+    tree aren't even read. This covers C files too, which have no
+    content-hash cache of their own. Python files are then analyzed with
+    the content-hash cache switched off, so each file leaves a single
+    cache entry rather than one under each kind of key.
+    
+    Args:
+        filepath: Path to the source file
+        use_pycparser: If True, analyze C files with pycparser
+        prefetched: Optional future from _prefetch_files holding the
+                    result of _load_file for this file
+        
+    Returns:
+        List of FunctionMetrics objects, or None if the file isn't Python
+        or C or couldn't be parsed
+        
+    Created: October 14, 2026
+    Last Modified: October 14, 2026
+    """
+    try:
+        if prefetched is not None:
+            cache_key, metrics, source = prefetched.result()
+        else:
+            cache_key, metrics, source = _load_file(filepath, use_pycparser)
+        if metrics is not None:
+            return metrics
+        
+        if source is not None:
+            metrics = analyze_python_source(source, filepath, use_cache=False)
+        elif filepath.suffix == '.py':
+            # Too big to read up front; map it as analyze_python_file would
+            with _map_source(os.fspath(filepath)) as mapped:
+                metrics = analyze_python_source(mapped, filepath, use_cache=False)
+        else:
+            metrics = analyze_source_file(filepath, use_pycparser)
+        
+        if cache_key is not None and metrics is not None:
+            _cache.put(cache_key, [_metrics_to_tuple(m) for m in metrics])
+        return metrics
+    except Exception:
+        # Skip files that can't be parsed or read: syntax and decoding
+        # errors, and pycparser errors for C files
+        # In a production tool, you might want to log these errors
+        return None
+
+
+def _load_file(filepath: Path, use_pycparser: bool) -> tuple:
+    """
+    Look a file up in the persistent cache and read it if it's a miss.
+    
+    This is the I/O half of _analyze_one, so it can run on a reader
+    thread while the previous file is being parsed. Only Python files are
+    read, and not those big enough that they're memory-mapped instead.
+    
+    Args:
+        filepath: Path to the source file
+        use_pycparser: If True, C files are analyzed with pycparser
+        
+    Returns:
+        Tuple of (cache_key, metrics, source). cache_key is None when the
+        cache is disabled, metrics is only set on a cache hit and source
+        only when the file was read
+        
+    Raises:
+        OSError: If the file can't be stat'ed or read
+        
+    Created: October 14, 2026
+    """
+    st = None
+    cache_key = None
+    if _cache.enabled():
+        st = os.stat(filepath)
+        analyzer = 'pycparser' if use_pycparser and filepath.suffix != '.py' else ''
+        cache_key = _cache.make_file_key(filepath, st.st_mtime_ns, st.st_size, analyzer)
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            return cache_key, [_metrics_from_tuple(row) for row in cached], None
+    
+    source = None
+    if filepath.suffix == '.py':
+        st = st or os.stat(filepath)
+        if st.st_size <= _MMAP_THRESHOLD:
+            source = _read_source(os.fspath(filepath))
+    return cache_key, None, source
+
+
+def _prefetch_files(source_files: List[Path], use_pycparser: bool) -> Iterator[Tuple[Path, Future]]:
+    """
+    Yield each file with a future for its _load_file result, reading ahead.
+    
+    Reading a file is I/O that releases the GIL, so reader threads can
+    fetch the next files while the caller parses the current one. That
+    hides read latency on slow disks and network filesystems. Only
+    _PREFETCH_WINDOW files are in flight at a time, in order.
+    
+    Args:
+        source_files: Files to load, in the order they'll be analyzed
+        use_pycparser: If True, C files are analyzed with pycparser
+        
+    Yields:
+        Tuples of (filepath, future) in the order of source_files
+        
+    Created: October 14, 2026
+    """
+    with ThreadPoolExecutor(max_workers=_PREFETCH_THREADS) as executor:
+        files = iter(source_files)
+        pending = deque(
+            (filepath, executor.submit(_load_file, filepath, use_pycparser))
+            for filepath in islice(files, _PREFETCH_WINDOW)
+        )
+        while pending:
+            # Top the window back up before handing out the oldest file
+            for filepath in islice(files, 1):
+                pending.append((filepath, executor.submit(_load_file, filepath, use_pycparser)))
+            yield pending.popleft()
 
 
 def analyze_directory(
     directory: Path,
     recursive: bool = True,
     include_c: bool = False,
-    progress_callback=None
+    progress_callback=None,
+    use_pycparser: bool = False,
+    jobs: int | None = 1,
+    stream: bool = False,
+    progress_interval: int = 1
 ) -> ProjectMetrics:
     """
     Analyze all source files in a directory.
@@ -176,13 +493,38 @@ def analyze_directory(
     This function scans a directory for Python (and optionally C) files
     and analyzes each one, aggregating the results into a ProjectMetrics object.
     
+    Each file is an independent, CPU-bound parse, so with more than one
+    job the files are spread over a process pool by _pool.map_files. The results are
+    still added to the project in sorted file order, so the outcome is the
+    same as a serial run.
+    
     Args:
         directory: Path to the directory to analyze
         recursive: If True, analyze subdirectories recursively
         include_c: If True, also analyze C source files
         progress_callback: Optional callback function called for each file
                           Signature: callback(current_file: Path, total_files: int, current_index: int)
-        
+                          In a serial run it's called as each file starts,
+                          in a parallel run as each file's result is
+                          collected, in file order
+        use_pycparser: If True, analyze C files with the full pycparser-based
+                       analyzer instead of the fast lexical scanner
+        jobs: Number of worker processes, or None for os.cpu_count(). The
+              default of 1 analyzes the files one after another in this
+              process. More than one starts a process pool, which on
+              platforms that spawn workers (Windows, macOS) needs the
+              calling script's entry point behind an
+              'if __name__ == "__main__":' guard
+        stream: If True, don't keep each file's metrics. The callback is
+                then called after each file with a fourth argument, that
+                file's metrics (None if it couldn't be analyzed), and the
+                returned project only has its totals, with an empty
+                file_metrics. This keeps memory flat on very large trees
+        progress_interval: Call progress_callback only for every Nth file
+                           (and always for the last one), for callbacks that
+                           cost a write per call. Ignored when streaming,
+                           since every file's metrics must be handed over
+                           
     Returns:
         ProjectMetrics object containing all analyzed files
         
@@ -193,7 +535,7 @@ def analyze_directory(
         >>> metrics = analyze_directory(Path("my_project"), progress_callback=show_progress)
         
     Created: February 1, 2026
-    Last Modified: February 1, 2026
+    Last Modified: October 14, 2026
     """
     # Find all source files in the directory
     source_files = find_source_files(directory, recursive, include_c)
@@ -201,30 +543,43 @@ def analyze_directory(
     # Create project metrics object
     project = ProjectMetrics()
     
-    # Analyze each file
     total_files = len(source_files)
-    for index, filepath in enumerate(source_files, start=1):
-        # Call progress callback if provided
-        if progress_callback:
-            progress_callback(filepath, total_files, index)
-        
-        try:
-            # Determine file type and use appropriate analyzer
-            if filepath.suffix == '.py':
-                metrics = analyze_python_file(filepath)
-            elif filepath.suffix in ['.c', '.h']:
-                metrics = analyze_c_file(filepath)
-            else:
-                continue
+    jobs = min(jobs or os.cpu_count() or 1, total_files)
+    
+    # Indexes at which a non-streaming callback is skipped
+    progress_interval = max(1, progress_interval)
+    
+    def skip_progress(index: int) -> bool:
+        return progress_interval > 1 and index % progress_interval and index != total_files
+    
+    if jobs <= 1:
+        # Analyze each file in turn; a pool isn't worth starting for one
+        # file. Reader threads load the next files while this one parses
+        prefetched_files = _prefetch_files(source_files, use_pycparser)
+        for index, (filepath, prefetched) in enumerate(prefetched_files, start=1):
+            # Call progress callback if provided
+            if progress_callback and not stream and not skip_progress(index):
+                progress_callback(filepath, total_files, index)
             
-            project.add_file(filepath, metrics)
-        except (SyntaxError, UnicodeDecodeError) as e:
-            # Skip files that can't be parsed
-            # In a production tool, you might want to log these errors
-            continue
-        except Exception as e:
-            # Skip files with any parsing errors
-            # This catches pycparser errors for C files
-            continue
+            metrics = _analyze_one(filepath, use_pycparser, prefetched)
+            if metrics is not None:
+                project.add_file(filepath, metrics, not stream)
+            
+            if progress_callback and stream:
+                progress_callback(filepath, total_files, index, metrics)
+        
+        return project
+    
+    # The pool hands out files in chunks; results still come back in file
+    # order, and are reported as each one is taken
+    all_metrics = _pool.map_files(_analyze_one, source_files, use_pycparser, jobs=jobs)
+    for index, (filepath, metrics) in enumerate(zip(source_files, all_metrics), start=1):
+        if metrics is not None:
+            project.add_file(filepath, metrics, not stream)
+        
+        if progress_callback and stream:
+            progress_callback(filepath, total_files, index, metrics)
+        elif progress_callback and not skip_progress(index):
+            progress_callback(filepath, total_files, index)
     
-    return project
\ No newline at end of file
+    return project
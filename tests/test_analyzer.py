@@ -0,0 +1,100 @@
+"""
+Code Complexity Analyzer - Python Analyzer Tests
+
+These tests pin the metrics reported for Python sources, in particular
+that line counting doesn't depend on the file's line endings.
+
+Run with: python -m unittest discover tests
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+import mmap
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from codecomplexity.analyzer import analyze_python_file, analyze_python_source
+
+
+# Two functions with a comment line, a blank line and a multi-line
+# statement, so both the LOC count and the function boundaries matter
+_SOURCE = (
+    b"def first(x):\n"
+    b"    # only a comment\n"
+    b"\n"
+    b"    if x and x > 1:\n"
+    b"        return (1 +\n"
+    b"                2)\n"
+    b"    return 0\n"
+    b"\n"
+    b"def second():\n"
+    b"    pass"
+)
+
+_EXPECTED = [
+    # (name, lineno, lines_of_code, cyclomatic_complexity)
+    ('first', 1, 5, 3),
+    ('second', 9, 2, 1),
+]
+
+
+def _summary(metrics):
+    """
+    Reduce metrics to comparable tuples.
+    
+    Created: October 14, 2026
+    """
+    return [(m.name, m.lineno, m.lines_of_code, m.cyclomatic_complexity) for m in metrics]
+
+
+class LineEndingTests(unittest.TestCase):
+    """
+    Check that LF, CRLF and CR-only sources give the same metrics.
+    
+    Created: October 14, 2026
+    """
+    
+    def _variants(self):
+        """
+        Yield the sample source with each kind of line ending.
+        
+        Created: October 14, 2026
+        """
+        for newline in (b'\n', b'\r\n', b'\r'):
+            source = _SOURCE.replace(b'\n', newline)
+            yield newline, source
+            # And with a final line end after the last line
+            yield newline, source + newline
+    
+    def test_bytes_source(self):
+        for newline, source in self._variants():
+            with self.subTest(newline=newline, trailing=source.endswith(newline)):
+                metrics = analyze_python_source(source, 'sample.py', use_cache=False)
+                self.assertEqual(_summary(metrics), _EXPECTED)
+    
+    def test_mmap_source(self):
+        # Large files are analyzed from a memory map, which is indexed
+        # separately from bytes
+        for newline, source in self._variants():
+            with self.subTest(newline=newline, trailing=source.endswith(newline)):
+                with tempfile.TemporaryFile() as f:
+                    f.write(source)
+                    f.flush()
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        metrics = analyze_python_source(mapped, 'sample.py', use_cache=False)
+                self.assertEqual(_summary(metrics), _EXPECTED)
+    
+    def test_file_with_cr_line_endings(self):
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.dict(os.environ, {'CODECOMPLEXITY_NO_CACHE': '1'}):
+            path = Path(directory) / 'mac.py'
+            path.write_bytes(_SOURCE.replace(b'\n', b'\r'))
+            self.assertEqual(_summary(analyze_python_file(path)), _EXPECTED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+"""
+Code Complexity Analyzer - Fast C Scanner Tests
+
+These tests pin the metrics the lexical C scanner reports, in particular
+for the tokens a regex scan can get wrong (keywords inside comments and
+strings, braces in character literals), and check that --pycparser still
+selects the pycparser-based analyzer.
+
+Run with: python -m unittest discover tests
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from codecomplexity import cli
+from codecomplexity.analyzer import FunctionMetrics
+from codecomplexity.c_analyzer_fast import analyze_c_source_fast
+from codecomplexity.scanner import analyze_source_file
+
+
+def _summary(metrics):
+    """
+    Reduce metrics to (name, lineno, LOC, complexity, nesting) tuples.
+    
+    Created: October 14, 2026
+    """
+    return [
+        (m.name, m.lineno, m.lines_of_code, m.cyclomatic_complexity, m.max_nesting_depth)
+        for m in metrics
+    ]
+
+
+def _run(*argv):
+    """
+    Run the CLI with the given arguments and return (exit code, stdout).
+    
+    Created: October 14, 2026
+    """
+    stdout = io.StringIO()
+    with mock.patch.object(sys, 'argv', ['codecomplexity', *argv]), \
+            mock.patch.dict(os.environ, {'CODECOMPLEXITY_NO_CACHE': '1'}), \
+            redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+        code = cli.main()
+    return code, stdout.getvalue()
+
+
+class FastScannerTests(unittest.TestCase):
+    """
+    Check the metrics of analyze_c_source_fast on small C functions.
+    
+    Created: October 14, 2026
+    """
+    
+    def test_keywords_in_comments_and_strings(self):
+        source = (
+            "/* if (a) while (b) for (;;) */\n"
+            "int f(void)\n"
+            "{\n"
+            "    // if (x && y) || z\n"
+            '    const char *s = "if && || while { case";\n'
+            "    char c = '{';\n"
+            "    char q = '\"';\n"
+            "    return s[0] + c + q;\n"
+            "}\n"
+        )
+        # Only the four code lines and the header and braces count, and
+        # the '{' literal doesn't open a block
+        self.assertEqual(_summary(analyze_c_source_fast(source)), [('f', 2, 7, 1, 0)])
+    
+    def test_else_if_chain(self):
+        source = (
+            "int sign(int x) {\n"
+            "    if (x > 0) {\n"
+            "        return 1;\n"
+            "    } else if (x < 0) {\n"
+            "        return -1;\n"
+            "    } else {\n"
+            "        return 0;\n"
+            "    }\n"
+            "}\n"
+        )
+        # One per 'if'; 'else' adds nothing
+        self.assertEqual(_summary(analyze_c_source_fast(source)), [('sign', 1, 9, 3, 1)])
+    
+    def test_switch_and_case(self):
+        source = (
+            "int name(int x) {\n"
+            "    switch (x) {\n"
+            "    case 1:\n"
+            "        return 10;\n"
+            "    case 2:\n"
+            "    case 3:\n"
+            "        return 20;\n"
+            "    default:\n"
+            "        return 0;\n"
+            "    }\n"
+            "}\n"
+        )
+        # One per 'case'; 'switch' and 'default' add nothing
+        self.assertEqual(_summary(analyze_c_source_fast(source)), [('name', 1, 11, 4, 1)])
+    
+    def test_logical_operators(self):
+        source = (
+            "int both(int a, int b, int c) {\n"
+            "    return (a && b) || (b && c) || a & c | b;\n"
+            "}\n"
+        )
+        # Four && and ||; the bitwise & and | add nothing
+        self.assertEqual(_summary(analyze_c_source_fast(source)), [('both', 1, 3, 5, 0)])
+    
+    def test_nested_braces(self):
+        source = (
+            "void walk(int n) {\n"
+            "    for (int i = 0; i < n; i++) {\n"
+            "        while (n) {\n"
+            "            {\n"
+            "                if (i) { n--; }\n"
+            "            }\n"
+            "        }\n"
+            "    }\n"
+            "    {\n"
+            "        n++;\n"
+            "    }\n"
+            "}\n"
+            "\n"
+            "struct point { int x; int y; };\n"
+            "static int after(void) { return 0; }\n"
+        )
+        # A bare block counts as a level too; the struct isn't a function
+        self.assertEqual(
+            _summary(analyze_c_source_fast(source)),
+            [('walk', 1, 12, 4, 4), ('after', 15, 1, 1, 0)]
+        )
+    
+    def test_function_after_directives_and_prototypes(self):
+        source = (
+            "#include <stdio.h>\n"
+            "#define MAX(a, b) \\\n"
+            "    ((a) > (b) ? (a) : (b))\n"
+            "int declared(int x);\n"
+            "int defined_here(int x) { if (x) return declared(x); return 0; }\n"
+        )
+        self.assertEqual(
+            _summary(analyze_c_source_fast(source)), [('defined_here', 5, 1, 2, 0)]
+        )
+
+
+class PycparserSelectionTests(unittest.TestCase):
+    """
+    Check that --pycparser routes C files to the pycparser-based analyzer.
+    
+    Created: October 14, 2026
+    """
+    
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.root = Path(self._directory.name)
+        self.source = self.root / 'a.c'
+        self.source.write_text("int f(void) { return 0; }\n")
+        
+        # Stands in for pycparser, with a name the fast scanner can't produce
+        patcher = mock.patch(
+            'codecomplexity.c_analyzer.analyze_c_file',
+            return_value=[FunctionMetrics('from_pycparser', 1)]
+        )
+        self.analyze_c_file = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_analyze_source_file(self):
+        self.assertEqual(analyze_source_file(self.source)[0].name, 'f')
+        self.analyze_c_file.assert_not_called()
+        
+        metrics = analyze_source_file(self.source, use_pycparser=True)
+        self.assertEqual(metrics[0].name, 'from_pycparser')
+        self.analyze_c_file.assert_called_once_with(self.source)
+    
+    def test_analyze_command(self):
+        code, out = _run('analyze', str(self.source), '--pycparser')
+        self.assertEqual(code, 0)
+        self.assertIn('from_pycparser', out)
+        
+        code, out = _run('analyze', str(self.source))
+        self.assertEqual(code, 0)
+        self.assertNotIn('from_pycparser', out)
+        self.assertEqual(self.analyze_c_file.call_count, 1)
+    
+    def test_scan_command(self):
+        # Serially, so the analysis runs in this process, under the mock
+        code, _ = _run('scan', str(self.root), '--include-c', '--pycparser', '--jobs', '1')
+        self.assertEqual(code, 0)
+        self.analyze_c_file.assert_called_once_with(self.source)
+        
+        code, _ = _run('scan', str(self.root), '--include-c', '--jobs', '1')
+        self.assertEqual(code, 0)
+        self.assertEqual(self.analyze_c_file.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
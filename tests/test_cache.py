@@ -0,0 +1,277 @@
+"""
+Code Complexity Analyzer - Result Cache Tests
+
+These tests check the persistent result cache: when keys change, how it's
+switched off, that entries are written atomically, that corrupt entries
+are treated as misses, and which entries a sweep deletes. Every test points XDG_CACHE_HOME at a
+temporary directory, so the user's own cache is never touched.
+
+Run with: python -m unittest discover tests
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+import os
+import pickle
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from codecomplexity import _cache
+from codecomplexity.analyzer import analyze_python_source
+
+
+_SOURCE = b"def f(x):\n    if x:\n        return 1\n    return 0\n"
+
+
+class CacheTestCase(unittest.TestCase):
+    """
+    Base class giving each test an empty cache directory of its own.
+    
+    Created: October 14, 2026
+    """
+    
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.root = Path(self._directory.name)
+        self.cache_dir = self.root / 'cache' / 'codecomplexity'
+        
+        environ = {'XDG_CACHE_HOME': str(self.root / 'cache')}
+        patcher = mock.patch.dict(os.environ, environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop('CODECOMPLEXITY_NO_CACHE', None)
+        
+        # Sweeping for old entries is tested on its own
+        patcher = mock.patch.object(_cache, '_prune_checked', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def entries(self):
+        """
+        List the names in the cache directory, sorted.
+        
+        Created: October 14, 2026
+        """
+        if not self.cache_dir.exists():
+            return []
+        return sorted(os.listdir(self.cache_dir))
+
+
+class KeyTests(CacheTestCase):
+    """
+    Check that keys change whenever the cached result could.
+    
+    Created: October 14, 2026
+    """
+    
+    def test_cache_dir_follows_xdg_cache_home(self):
+        self.assertEqual(_cache._cache_dir(), self.cache_dir)
+    
+    def test_content_key(self):
+        key = _cache.make_key(_SOURCE)
+        self.assertEqual(key, _cache.make_key(bytes(_SOURCE)))
+        self.assertNotEqual(key, _cache.make_key(_SOURCE + b"\n"))
+        
+        with mock.patch.object(_cache, 'CACHE_VERSION', _cache.CACHE_VERSION + 1):
+            self.assertNotEqual(key, _cache.make_key(_SOURCE))
+    
+    def test_file_key(self):
+        key = _cache.make_file_key('a.py', 1_000, 10)
+        self.assertEqual(key, _cache.make_file_key('a.py', 1_000, 10))
+        # A relative path names the same file as its absolute form
+        self.assertEqual(key, _cache.make_file_key(os.path.abspath('a.py'), 1_000, 10))
+        
+        for changed in (
+            _cache.make_file_key('b.py', 1_000, 10),
+            _cache.make_file_key('a.py', 1_001, 10),
+            _cache.make_file_key('a.py', 1_000, 11),
+            _cache.make_file_key('a.py', 1_000, 10, 'pycparser'),
+        ):
+            self.assertNotEqual(key, changed)
+        
+        with mock.patch.object(_cache, 'CACHE_VERSION', _cache.CACHE_VERSION + 1):
+            self.assertNotEqual(key, _cache.make_file_key('a.py', 1_000, 10))
+    
+    def test_file_key_tracks_edits(self):
+        path = self.root / 'a.py'
+        path.write_bytes(_SOURCE)
+        st = os.stat(path)
+        key = _cache.make_file_key(path, st.st_mtime_ns, st.st_size)
+        
+        # Same size, new modification time
+        path.write_bytes(_SOURCE.replace(b'1', b'2'))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        edited = os.stat(path)
+        self.assertEqual(edited.st_size, st.st_size)
+        self.assertNotEqual(key, _cache.make_file_key(path, edited.st_mtime_ns, edited.st_size))
+        
+        # Same modification time, new size
+        path.write_bytes(_SOURCE + b"\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        grown = os.stat(path)
+        self.assertEqual(grown.st_mtime_ns, st.st_mtime_ns)
+        self.assertNotEqual(key, _cache.make_file_key(path, grown.st_mtime_ns, grown.st_size))
+    
+    def test_undecodable_file_name(self):
+        # Surrogate-escaped names must still give a key
+        name = os.fsdecode(b'bad\xffname.py')
+        self.assertNotEqual(_cache.make_file_key(name, 1, 1), _cache.make_file_key('badname.py', 1, 1))
+
+
+class StorageTests(CacheTestCase):
+    """
+    Check reading and writing entries.
+    
+    Created: October 14, 2026
+    """
+    
+    def test_round_trip(self):
+        self.assertIsNone(_cache.get('k'))
+        _cache.put('k', [('f', 1, 2)])
+        self.assertEqual(_cache.get('k'), [('f', 1, 2)])
+        self.assertEqual(self.entries(), ['k'])
+    
+    def test_no_cache_environment_variable(self):
+        self.assertTrue(_cache.enabled())
+        for value in ('1', 'yes'):
+            with self.subTest(value=value), \
+                    mock.patch.dict(os.environ, {'CODECOMPLEXITY_NO_CACHE': value}):
+                self.assertFalse(_cache.enabled())
+                analyze_python_source(_SOURCE, 'a.py')
+                self.assertEqual(self.entries(), [])
+        # An empty value doesn't count as set
+        with mock.patch.dict(os.environ, {'CODECOMPLEXITY_NO_CACHE': ''}):
+            self.assertTrue(_cache.enabled())
+    
+    def test_analysis_is_cached(self):
+        first = analyze_python_source(_SOURCE, 'a.py')
+        self.assertEqual(self.entries(), [_cache.make_key(_SOURCE)])
+        
+        with mock.patch('codecomplexity.analyzer.PythonAnalyzer') as analyzer:
+            second = analyze_python_source(_SOURCE, 'a.py')
+        analyzer.assert_not_called()
+        self.assertEqual(
+            [(m.name, m.cyclomatic_complexity) for m in second],
+            [(m.name, m.cyclomatic_complexity) for m in first]
+        )
+    
+    def test_put_replaces_atomically(self):
+        _cache.put('k', 'old')
+        real_dump = pickle.dump
+        
+        def failing_dump(value, f, protocol=None):
+            # Write part of an entry, then fail
+            real_dump(value, f, protocol=protocol)
+            raise OSError("disk full")
+        
+        with mock.patch.object(pickle, 'dump', failing_dump):
+            _cache.put('k', 'new')
+        # The old entry is intact and the temporary file is gone
+        self.assertEqual(_cache.get('k'), 'old')
+        self.assertEqual(self.entries(), ['k'])
+        
+        _cache.put('k', 'new')
+        self.assertEqual(_cache.get('k'), 'new')
+        self.assertEqual(self.entries(), ['k'])
+    
+    def test_unwritable_cache_dir(self):
+        # A file where the directory should be; put must not raise
+        self.cache_dir.parent.mkdir()
+        self.cache_dir.write_bytes(b'')
+        _cache.put('k', 'value')
+        self.assertIsNone(_cache.get('k'))
+    
+    def test_corrupt_entry_is_a_miss(self):
+        self.cache_dir.mkdir(parents=True)
+        for contents in (b'', b'not a pickle', pickle.dumps('value')[:-3]):
+            with self.subTest(contents=contents):
+                (self.cache_dir / 'k').write_bytes(contents)
+                self.assertIsNone(_cache.get('k'))
+    
+    def test_corrupt_entry_is_rewritten(self):
+        key = _cache.make_key(_SOURCE)
+        self.cache_dir.mkdir(parents=True)
+        (self.cache_dir / key).write_bytes(b'garbage')
+        
+        metrics = analyze_python_source(_SOURCE, 'a.py')
+        self.assertEqual([(m.name, m.cyclomatic_complexity) for m in metrics], [('f', 2)])
+        self.assertIsNotNone(_cache.get(key))
+
+
+
+# Comfortably past MAX_AGE_DAYS, in seconds
+_EXPIRED = (_cache.MAX_AGE_DAYS + 1) * 24 * 60 * 60
+
+
+class PruneTests(CacheTestCase):
+    """
+    Check that sweeps delete unused entries only, and not too often.
+    
+    Created: October 14, 2026
+    """
+    
+    def write_entry(self, name: str, age: float) -> Path:
+        """
+        Write a cache entry last modified age seconds ago.
+        
+        Created: October 14, 2026
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / name
+        path.write_bytes(pickle.dumps(name))
+        then = time.time() - age
+        os.utime(path, (then, then))
+        return path
+    
+    def test_sweep_deletes_expired_entries(self):
+        self.write_entry('old', _EXPIRED)
+        self.write_entry('.tmp-interrupted', _EXPIRED)
+        self.write_entry('recent', 60)
+        _cache._prune(self.cache_dir)
+        self.assertEqual(self.entries(), [_cache._PRUNE_MARKER, 'recent'])
+    
+    def test_sweeps_are_spaced_out(self):
+        self.write_entry('old', _EXPIRED)
+        marker = self.write_entry(_cache._PRUNE_MARKER, 60)
+        # Swept a minute ago, so not due yet
+        _cache._prune(self.cache_dir)
+        self.assertIn('old', self.entries())
+        
+        then = time.time() - _cache._PRUNE_INTERVAL - 60
+        os.utime(marker, (then, then))
+        _cache._prune(self.cache_dir)
+        self.assertNotIn('old', self.entries())
+        # The marker was claimed for the next interval
+        self.assertLess(time.time() - marker.stat().st_mtime, 60)
+    
+    def test_put_sweeps_once_per_process(self):
+        with mock.patch.object(_cache, '_prune_checked', False), \
+                mock.patch.object(_cache, '_prune', wraps=_cache._prune) as prune:
+            _cache.put('a', 1)
+            _cache.put('b', 2)
+        prune.assert_called_once_with(self.cache_dir)
+    
+    def test_hit_keeps_entry_from_expiring(self):
+        path = self.write_entry('used', _EXPIRED)
+        self.write_entry('unused', _EXPIRED)
+        self.assertEqual(_cache.get('used'), 'used')
+        self.assertLess(time.time() - path.stat().st_mtime, 60)
+        
+        _cache._prune(self.cache_dir)
+        self.assertEqual(self.entries(), [_cache._PRUNE_MARKER, 'used'])
+    
+    def test_recent_hit_isnt_touched(self):
+        # Entries used within the sweep interval aren't rewritten on a hit
+        path = self.write_entry('used', 60)
+        mtime = path.stat().st_mtime_ns
+        self.assertEqual(_cache.get('used'), 'used')
+        self.assertEqual(path.stat().st_mtime_ns, mtime)
+
+
+if __name__ == '__main__':
+    unittest.main()
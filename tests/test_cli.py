@@ -0,0 +1,360 @@
+"""
+Code Complexity Analyzer - Command-Line Interface Tests
+
+These tests run the CLI's main() in-process with a patched argv and check
+exit codes and output, in particular for invalid input.
+
+Run with: python -m unittest discover tests
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+import io
+import os
+import re
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from itertools import combinations
+from pathlib import Path
+from unittest import mock
+
+from codecomplexity import cli
+from codecomplexity.analyzer import FunctionMetrics
+
+
+def _run(*argv):
+    """
+    Run the CLI with the given arguments and capture what it prints.
+    
+    Returns:
+        Tuple of (exit code, stdout text, stderr text). An argparse error
+        exits through SystemExit, whose code is returned
+        
+    Created: October 14, 2026
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with mock.patch.object(sys, 'argv', ['codecomplexity', *argv]), \
+            mock.patch.dict(os.environ, {'CODECOMPLEXITY_NO_CACHE': '1'}), \
+            redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            code = cli.main()
+        except SystemExit as e:
+            code = e.code
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+class PathErrorTests(unittest.TestCase):
+    """
+    Check that unusable paths are reported without a traceback.
+    
+    Created: October 14, 2026
+    """
+    
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.root = Path(self._directory.name)
+    
+    def test_missing_path(self):
+        missing = str(self.root / 'missing.py')
+        code, _, err = _run('analyze', missing)
+        self.assertEqual(code, 1)
+        self.assertIn(f"Error: File '{missing}' not found.", err)
+        
+        code, _, err = _run('scan', missing)
+        self.assertEqual(code, 1)
+        self.assertIn(f"Error: Directory '{missing}' not found.", err)
+    
+    @unittest.skipUnless(hasattr(os, 'symlink'), "needs symlinks")
+    def test_symlink_loop(self):
+        loop1, loop2 = self.root / 'loop1', self.root / 'loop2'
+        try:
+            os.symlink(loop2, loop1)
+            os.symlink(loop1, loop2)
+        except OSError:
+            self.skipTest("can't create symlinks here")
+        for command in ('analyze', 'scan'):
+            with self.subTest(command=command):
+                code, _, err = _run(command, str(loop1))
+                self.assertEqual(code, 1)
+                self.assertIn(f"Error: Cannot access '{loop1}'", err)
+    
+    def test_embedded_nul(self):
+        for command, kind in (('analyze', 'File'), ('scan', 'Directory')):
+            with self.subTest(command=command):
+                code, _, err = _run(command, 'bad\0name')
+                self.assertEqual(code, 1)
+                self.assertIn(f"Error: {kind} 'bad\0name' not found.", err)
+    
+    def test_wrong_kind_of_path(self):
+        code, _, err = _run('analyze', str(self.root))
+        self.assertEqual(code, 1)
+        self.assertIn("is not a file.", err)
+        
+        source = self.root / 'a.py'
+        source.write_text("def f():\n    pass\n")
+        code, _, err = _run('scan', str(source))
+        self.assertEqual(code, 1)
+        self.assertIn("is not a directory.", err)
+
+
+class OptionValidationTests(unittest.TestCase):
+    """
+    Check that out-of-range option values are rejected before any work.
+    
+    Created: October 14, 2026
+    """
+    
+    def test_jobs_below_one(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for jobs in ('0', '-2'):
+                for flag in ('--jobs', '-j'):
+                    with self.subTest(flag=flag, jobs=jobs):
+                        code, out, err = _run('scan', directory, flag, jobs)
+                        self.assertEqual(code, 1)
+                        self.assertIn("Error: --jobs must be at least 1.", err)
+                        self.assertNotIn("Scanning", out)
+    
+    def test_jobs_of_one(self):
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, 'a.py').write_text("def f():\n    pass\n")
+            code, _, err = _run('scan', directory, '--jobs', '1')
+            self.assertEqual(code, 0)
+            self.assertEqual(err, '')
+
+
+# Every option of each subcommand, with a valid value for those that take
+# one and None for switches, and the short alias of an option if any
+_OPTIONS = {
+    'analyze': [
+        ('--complexity-threshold', '7'), ('--loc-threshold', '30'),
+        ('--nesting-threshold', '2'), ('--warnings-only', None), ('--top', '5'),
+        ('--output', 'out.json'), ('--indent', '2'), ('--pycparser', None),
+    ],
+    'scan': [
+        ('--no-recursive', None), ('--complexity-threshold', '7'),
+        ('--loc-threshold', '30'), ('--nesting-threshold', '2'),
+        ('--output', 'out.json'), ('--indent', '2'), ('--include-c', None),
+        ('--pycparser', None), ('--jobs', '3'),
+    ],
+}
+_SHORT_OPTIONS = {'--output': '-o', '--jobs': '-j'}
+
+
+def _command_lines(command):
+    """
+    Yield command lines using every combination of a subcommand's options.
+    
+    Each combination is written with separate values, with --name=value,
+    and with the short aliases, and with the positional argument first
+    and last.
+    
+    Created: October 14, 2026
+    """
+    options = _OPTIONS[command]
+    for count in range(len(options) + 1):
+        for chosen in combinations(options, count):
+            for style in ('separate', 'equals', 'short'):
+                args = []
+                for name, value in chosen:
+                    if style == 'short':
+                        name = _SHORT_OPTIONS.get(name, name)
+                    if value is None:
+                        args.append(name)
+                    elif style == 'equals':
+                        args.append(f'{name}={value}')
+                    else:
+                        args.extend((name, value))
+                yield [command, 'target', *args]
+                yield [command, *args, 'target']
+
+
+def _shown(report):
+    """
+    List the names of the functions in a report, in the order shown.
+    
+    Created: October 14, 2026
+    """
+    return re.findall(r'Function: (\w+) ', report)
+
+
+class TopTests(unittest.TestCase):
+    """
+    Check that --top shows the N most complex functions, in sorted order.
+    
+    Created: October 14, 2026
+    """
+    
+    def setUp(self):
+        # Complexities with ties, listed out of order
+        self.metrics = []
+        for lineno, (name, complexity) in enumerate(
+                [('a', 3), ('b', 7), ('c', 3), ('d', 12), ('e', 7), ('f', 1), ('g', 3)], start=1):
+            m = FunctionMetrics(name, lineno)
+            m.cyclomatic_complexity = complexity
+            self.metrics.append(m)
+    
+    def report(self, top=None, warnings_only=False):
+        """
+        Format the sample metrics with the default thresholds.
+        
+        Created: October 14, 2026
+        """
+        return cli.format_metrics_output(self.metrics, 10, 50, 4, warnings_only, top=top)
+    
+    def test_top_is_a_prefix_of_the_full_report(self):
+        full = _shown(self.report())
+        # Ties keep their original order, as in a stable sort
+        self.assertEqual(full, ['d', 'b', 'e', 'a', 'c', 'g', 'f'])
+        for top in range(1, len(full) + 1):
+            with self.subTest(top=top):
+                self.assertEqual(_shown(self.report(top)), full[:top])
+    
+    def test_top_larger_than_function_count(self):
+        self.assertEqual(self.report(len(self.metrics) + 1), self.report())
+        self.assertEqual(self.report(1000), self.report())
+    
+    def test_summary_covers_only_shown_functions(self):
+        report = self.report(3)
+        self.assertIn("Total Functions Analyzed: 3", report)
+        self.assertIn("Average Complexity: 8.67", report)
+        self.assertIn("Highest Complexity: 12", report)
+        self.assertIn("Functions Exceeding Thresholds: ", report)
+    
+    def test_top_applies_after_warnings_only(self):
+        # Only 'd' exceeds the complexity threshold of 10
+        self.assertEqual(_shown(self.report(3, warnings_only=True)), ['d'])
+    
+    def test_values_below_one_are_rejected(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory, 'a.py')
+            source.write_text("def f():\n    pass\n")
+            for top in ('0', '-1'):
+                with self.subTest(top=top):
+                    code, out, err = _run('analyze', str(source), '--top', top)
+                    self.assertEqual(code, 1)
+                    self.assertIn("Error: --top must be at least 1.", err)
+                    self.assertNotIn("Function: f", out)
+            
+            code, out, _ = _run('analyze', str(source), '--top', '5')
+            self.assertEqual(code, 0)
+            self.assertEqual(_shown(out), ['f'])
+
+
+class FastParserTests(unittest.TestCase):
+    """
+    Check that _parse_args_fast agrees with argparse, and hands everything
+    it can't parse back to it.
+    
+    Created: October 14, 2026
+    """
+    
+    def _argparse(self, argv):
+        """
+        Parse argv with the argparse parser main() would fall back to.
+        
+        Created: October 14, 2026
+        """
+        return cli.create_parser(argv[0]).parse_args(argv)
+    
+    def test_same_namespace_as_argparse(self):
+        for command in _OPTIONS:
+            count = 0
+            for argv in _command_lines(command):
+                count += 1
+                fast = cli._parse_args_fast(argv)
+                self.assertIsNotNone(fast, argv)
+                self.assertEqual(vars(fast), vars(self._argparse(argv)), argv)
+            # Every combination was tried, in six spellings
+            self.assertEqual(count, 6 * 2 ** len(_OPTIONS[command]))
+    
+    def test_repeated_option_keeps_last_value(self):
+        argv = ['analyze', 'a.py', '--top', '3', '--top=4']
+        self.assertEqual(vars(cli._parse_args_fast(argv)), vars(self._argparse(argv)))
+        self.assertEqual(cli._parse_args_fast(argv).top, 4)
+    
+    def test_dash_is_a_positional(self):
+        argv = ['analyze', '-']
+        self.assertEqual(vars(cli._parse_args_fast(argv)), vars(self._argparse(argv)))
+    
+    def test_malformed_input_is_left_to_argparse(self):
+        malformed = [
+            ['check', 'a.py'],
+            ['analyze'],
+            ['analyze', 'a.py', 'b.py'],
+            ['analyze', 'a.py', '--bogus'],
+            ['analyze', 'a.py', '--top'],
+            ['analyze', 'a.py', '--top', 'x'],
+            ['analyze', 'a.py', '--top=x'],
+            ['analyze', 'a.py', '--top', '--warnings-only'],
+            ['analyze', 'a.py', '--warnings-only=yes'],
+            ['analyze', 'a.py', '--jobs', '2'],
+            ['scan', '.', '--top', '2'],
+            ['scan', '.', '-j'],
+        ]
+        for argv in malformed:
+            with self.subTest(argv=argv):
+                self.assertIsNone(cli._parse_args_fast(argv))
+                code, _, err = _run(*argv)
+                self.assertEqual(code, 2)
+                self.assertIn("usage: codecomplexity", err)
+    
+    def test_help_is_left_to_argparse(self):
+        for argv in (['analyze', '-h'], ['scan', '.', '--help']):
+            with self.subTest(argv=argv):
+                self.assertIsNone(cli._parse_args_fast(argv))
+                code, out, _ = _run(*argv)
+                self.assertEqual(code, 0)
+                self.assertIn(f"usage: codecomplexity {argv[0]}", out)
+    
+    def test_fallback_accepts_what_argparse_accepts(self):
+        # Left to argparse, which parses these: values that look like
+        # negative numbers, unambiguous abbreviations and -j=N
+        for argv in (
+            ['analyze', 'a.py', '--indent', '-1'],
+            ['analyze', 'a.py', '--warn'],
+            ['scan', '.', '--incl'],
+            ['scan', '.', '-j=2'],
+        ):
+            with self.subTest(argv=argv):
+                self.assertIsNone(cli._parse_args_fast(argv))
+                self.assertEqual(self._argparse(argv).command, argv[0])
+    
+    def test_main_skips_argparse_for_well_formed_input(self):
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, 'a.py').write_text("def f():\n    pass\n")
+            with mock.patch.object(cli, 'create_parser', side_effect=AssertionError):
+                code, _, _ = _run('scan', directory, '--jobs', '1')
+            self.assertEqual(code, 0)
+
+
+class UsageTests(unittest.TestCase):
+    """
+    Check that argument errors list every subcommand in the usage line.
+    
+    Created: October 14, 2026
+    """
+    
+    def test_unknown_flag_lists_all_subcommands(self):
+        for command in ('analyze', 'scan'):
+            with self.subTest(command=command):
+                code, _, err = _run(command, '.', '--bogus')
+                self.assertEqual(code, 2)
+                self.assertIn("usage: codecomplexity [-h] {analyze,scan} ...", err)
+                self.assertIn("unrecognized arguments: --bogus", err)
+    
+    def test_help_lists_all_subcommands(self):
+        for command in ('analyze', 'scan'):
+            with self.subTest(command=command):
+                # The parser main() builds when that subcommand is given
+                help_text = cli.create_parser(command).format_help()
+                self.assertIn("{analyze,scan}", help_text)
+                self.assertIn("Scan a directory", help_text)
+                self.assertIn("Analyze a Python or C file", help_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
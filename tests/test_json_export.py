@@ -0,0 +1,183 @@
+"""
+Code Complexity Analyzer - JSON Export Tests
+
+These tests check that JSON exports come out byte-for-byte the same
+whether they're written with orjson (the optional 'fast' extra) or with
+the standard library's encoder, including for non-ASCII names and paths.
+
+Run with: python -m unittest discover tests
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from codecomplexity import cli
+from codecomplexity.analyzer import FunctionMetrics
+from codecomplexity.scanner import ProjectMetrics
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# A fixed time, so exports written at different moments can be compared
+_FIXED_NOW = datetime(2026, 10, 14, 12, 0, 0)
+
+
+def _sample_metrics():
+    """
+    Build metrics for two functions, one with a non-ASCII name.
+    
+    Created: October 14, 2026
+    """
+    plain = FunctionMetrics('plain', 1)
+    plain.lines_of_code = 3
+    
+    accented = FunctionMetrics('größe_λ', 5)
+    accented.lines_of_code = 12
+    accented.cyclomatic_complexity = 4
+    accented.max_nesting_depth = 2
+    return [plain, accented]
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class JsonExportEncoderTests(unittest.TestCase):
+    """
+    Compare the exports written by orjson and by the standard library.
+    
+    Created: October 14, 2026
+    """
+    
+    def _export(self, export, use_orjson: bool) -> bytes:
+        """
+        Run an export function into a temporary file and return its bytes.
+        
+        Args:
+            export: Callable taking the output file path
+            use_orjson: If False, hide orjson so the fallback encoder is used
+            
+        Created: October 14, 2026
+        """
+        # A None entry in sys.modules makes "import orjson" raise ImportError
+        modules = {} if use_orjson else {'orjson': None}
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.dict(sys.modules, modules), \
+                mock.patch.object(cli, 'datetime', mock.Mock(now=lambda: _FIXED_NOW)), \
+                redirect_stdout(io.StringIO()):
+            output_file = Path(directory) / 'out.json'
+            export(output_file)
+            return output_file.read_bytes()
+    
+    def _assert_same_output(self, export) -> bytes:
+        """
+        Check that both encoders write the same bytes, and return them.
+        
+        Created: October 14, 2026
+        """
+        fast = self._export(export, use_orjson=True)
+        fallback = self._export(export, use_orjson=False)
+        self.assertEqual(fast, fallback)
+        return fast
+    
+    def test_function_export_matches(self):
+        metrics = _sample_metrics()
+        for indent in (None, 2):
+            with self.subTest(indent=indent):
+                data = self._assert_same_output(
+                    lambda out: cli.export_to_json(metrics, 'módulo.py', out, indent)
+                )
+                # Written as UTF-8, not as \uXXXX escapes
+                self.assertIn('größe_λ'.encode('utf-8'), data)
+                self.assertIn('módulo.py'.encode('utf-8'), data)
+                self.assertNotIn(b'\\u', data)
+    
+    def test_project_export_matches(self):
+        project = ProjectMetrics()
+        project.add_file(Path('paquete') / 'módulo.py', _sample_metrics())
+        for indent in (None, 2):
+            with self.subTest(indent=indent):
+                data = self._assert_same_output(
+                    lambda out: cli.export_project_to_json(project, out, indent)
+                )
+                self.assertIn('größe_λ'.encode('utf-8'), data)
+                self.assertNotIn(b'\\u', data)
+    
+    def test_undecodable_file_name(self):
+        # A file name that isn't valid UTF-8 reaches us with surrogates
+        # (surrogateescape), which can't be written as UTF-8
+        bad_path = Path(os.fsdecode(b'bad\xffname.py'))
+        project = ProjectMetrics()
+        project.add_file(bad_path, _sample_metrics())
+        project.add_file(Path('módulo.py'), _sample_metrics())
+        for indent in (None, 2):
+            with self.subTest(indent=indent):
+                data = self._assert_same_output(
+                    lambda out: cli.export_project_to_json(project, out, indent)
+                )
+                # Still valid JSON that gives the same strings back
+                files = [entry['file'] for entry in json.loads(data)['files']]
+                self.assertEqual(files, [str(bad_path), 'módulo.py'])
+                self.assertIn(b'bad\\udcffname.py', data)
+    
+    def test_undecodable_file_name_single_file(self):
+        metrics = _sample_metrics()
+        bad_name = os.fsdecode(b'bad\xffname.py')
+        data = self._assert_same_output(
+            lambda out: cli.export_to_json(metrics, bad_name, out)
+        )
+        self.assertEqual(json.loads(data)['file'], bad_name)
+
+
+
+class AtomicExportTests(unittest.TestCase):
+    """
+    Check that a failed export leaves the previous output file intact.
+    
+    Created: October 14, 2026
+    """
+    
+    def test_failed_project_export_keeps_old_file(self):
+        project = ProjectMetrics()
+        project.add_file(Path('a.py'), _sample_metrics())
+        project.add_file(Path('b.py'), _sample_metrics())
+        
+        def failing_records(project, file_stats=None):
+            # Fail after the first entry has already been written
+            yield {"file": "a.py"}
+            raise RuntimeError("disk on fire")
+        
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.object(cli, '_file_records', failing_records), \
+                redirect_stdout(io.StringIO()):
+            output_file = Path(directory) / 'out.json'
+            output_file.write_bytes(b'{"old": true}')
+            with self.assertRaises(RuntimeError):
+                cli.export_project_to_json(project, str(output_file))
+            
+            self.assertEqual(output_file.read_bytes(), b'{"old": true}')
+            self.assertEqual(os.listdir(directory), ['out.json'])
+    
+    def test_export_replaces_file(self):
+        with tempfile.TemporaryDirectory() as directory, redirect_stdout(io.StringIO()):
+            output_file = Path(directory) / 'out.json'
+            output_file.write_bytes(b'{"old": true}')
+            cli.export_to_json(_sample_metrics(), 'a.py', str(output_file))
+            
+            self.assertEqual(json.loads(output_file.read_bytes())['file'], 'a.py')
+            self.assertEqual(os.listdir(directory), ['out.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Code Complexity Analyzer - Process Pool Tests
+
+These tests check _pool.map_files and the batch entry points built on it,
+analyze_python_files and analyze_c_files: results in input order, the
+same metrics as one file at a time, and chunked hand-out to the workers.
+
+Run with: python -m unittest discover tests
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from codecomplexity import _pool
+from codecomplexity.analyzer import analyze_python_file, analyze_python_files
+
+try:
+    from codecomplexity.c_analyzer import analyze_c_file, analyze_c_files
+except ImportError:
+    analyze_c_files = None
+
+
+def _summary(metrics):
+    """
+    Reduce metrics to comparable tuples.
+    
+    Created: October 14, 2026
+    """
+    return [(m.name, m.lineno, m.lines_of_code, m.cyclomatic_complexity) for m in metrics]
+
+
+class _RecordingExecutor:
+    """
+    Stand-in for ProcessPoolExecutor that runs map() here and records it.
+    
+    Created: October 14, 2026
+    """
+    
+    instances = []
+    
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self.chunksize = None
+        _RecordingExecutor.instances.append(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def map(self, func, *iterables, chunksize=1):
+        self.chunksize = chunksize
+        return map(func, *iterables)
+
+
+class MapFilesTests(unittest.TestCase):
+    """
+    Check how map_files hands out work.
+    
+    Created: October 14, 2026
+    """
+    
+    def setUp(self):
+        _RecordingExecutor.instances = []
+        patcher = mock.patch.object(_pool, 'ProcessPoolExecutor', _RecordingExecutor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_results_in_order_with_extra_arguments(self):
+        paths = [f'f{i}' for i in range(10)]
+        results = list(_pool.map_files(os.path.join, paths, 'x', jobs=3))
+        self.assertEqual(results, [os.path.join(path, 'x') for path in paths])
+    
+    def test_chunksize(self):
+        for count, jobs, chunksize in ((100, 4, 6), (10, 4, 1), (1000, 2, 125)):
+            with self.subTest(count=count, jobs=jobs):
+                list(_pool.map_files(str, range(count), jobs=jobs))
+                executor = _RecordingExecutor.instances[-1]
+                self.assertEqual((executor.max_workers, executor.chunksize), (jobs, chunksize))
+    
+    def test_no_more_workers_than_files(self):
+        list(_pool.map_files(str, range(3), jobs=8))
+        self.assertEqual(_RecordingExecutor.instances[-1].max_workers, 3)
+    
+    def test_no_pool_for_one_job_or_one_file(self):
+        self.assertEqual(list(_pool.map_files(str, range(5), jobs=1)), list(map(str, range(5))))
+        self.assertEqual(list(_pool.map_files(str, [7], jobs=4)), ['7'])
+        self.assertEqual(list(_pool.map_files(str, [], jobs=4)), [])
+        self.assertEqual(_RecordingExecutor.instances, [])
+    
+    def test_jobs_below_one(self):
+        for jobs in (0, -1):
+            with self.subTest(jobs=jobs), self.assertRaises(ValueError):
+                list(_pool.map_files(str, range(3), jobs=jobs))
+
+
+class BatchAnalysisTests(unittest.TestCase):
+    """
+    Check the batch entry points against one-file-at-a-time analysis.
+    
+    Created: October 14, 2026
+    """
+    
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.root = Path(self._directory.name)
+        
+        patcher = mock.patch.dict(os.environ, {'CODECOMPLEXITY_NO_CACHE': '1'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_python_files(self):
+        paths = []
+        for i in range(6):
+            path = self.root / f'm{i}.py'
+            path.write_text("def f(x):\n" + "    if x:\n        x -= 1\n" * i + "    return x\n")
+            paths.append(path)
+        # Out of sorted order, to check the input order is kept
+        paths.reverse()
+        
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = analyze_python_files(paths, workers=workers)
+                self.assertEqual(list(results), paths)
+                for path in paths:
+                    self.assertEqual(_summary(results[path]), _summary(analyze_python_file(path)))
+        self.assertEqual(analyze_python_files([]), {})
+    
+    def test_python_error_is_raised(self):
+        good, bad = self.root / 'good.py', self.root / 'bad.py'
+        good.write_text("def f():\n    pass\n")
+        bad.write_text("def f(:\n")
+        for workers in (1, 2):
+            with self.subTest(workers=workers), self.assertRaises(SyntaxError):
+                analyze_python_files([good, bad], workers=workers)
+    
+    def test_workers_below_one(self):
+        with self.assertRaises(ValueError):
+            analyze_python_files([self.root / 'a.py'], workers=0)
+    
+    @unittest.skipIf(analyze_c_files is None, "pycparser is not installed")
+    def test_c_files(self):
+        paths = []
+        for i in range(3):
+            path = self.root / f'c{i}.c'
+            path.write_text(f"int f{i}(int x) {{ if (x > {i}) return 1; return 0; }}\n")
+            paths.append(path)
+        
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = analyze_c_files(paths, workers=workers)
+                self.assertEqual(list(results), paths)
+                for path in paths:
+                    self.assertEqual(_summary(results[path]), _summary(analyze_c_file(path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,490 @@
+"""
+Code Complexity Analyzer - Directory Scanner Tests
+
+These tests check finding source files in a directory tree and analyzing
+them with analyze_directory, serially, in parallel and streamed.
+
+Run with: python -m unittest discover tests
+
+Author: Dylan
+Created: October 14, 2026
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from codecomplexity import _cache, scanner
+from codecomplexity.scanner import ProjectMetrics, analyze_directory, find_source_files
+
+
+def _summary(project):
+    """
+    Reduce a project's per-file metrics to comparable tuples.
+    
+    Created: October 14, 2026
+    """
+    return [
+        (str(filepath), [(m.name, m.lineno, m.lines_of_code, m.cyclomatic_complexity) for m in metrics])
+        for filepath, metrics in project.file_metrics.items()
+    ]
+
+
+class ScannerTestCase(unittest.TestCase):
+    """
+    Base class giving each test a fresh source tree and no persistent cache.
+    
+    Created: October 14, 2026
+    """
+    
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self._directory.cleanup)
+        self.root = Path(self._directory.name)
+        
+        patcher = mock.patch.dict(os.environ, {'CODECOMPLEXITY_NO_CACHE': '1'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def write_files(self, count: int) -> None:
+        """
+        Write count small Python files, each with its own complexity.
+        
+        Created: October 14, 2026
+        """
+        for i in range(count):
+            branches = ''.join(f"    if x == {j}:\n        return {j}\n" for j in range(i))
+            path = self.root / f"pkg{i % 2}" / f"mod{i}.py"
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(f"def f{i}(x):\n{branches}    return x\n")
+
+
+def _rglob_reference(directory: Path, recursive: bool, include_c: bool):
+    """
+    Find source files the way find_source_files did before it used scandir.
+    
+    This is the original Path.rglob version, with the fixes made since:
+    excluded directory names are only matched below the scanned directory
+    (not in its own path), *.egg-info directories are really skipped, and
+    only files count (not directories named like one, or broken links).
+    
+    Created: October 14, 2026
+    """
+    patterns = ['*.py', '*.c', '*.h'] if include_c else ['*.py']
+    found = []
+    for pattern in patterns:
+        paths = directory.rglob(pattern) if recursive else directory.glob(pattern)
+        for path in paths:
+            parents = path.relative_to(directory).parts[:-1]
+            if any(part in scanner._SKIP_DIRS or part.endswith('.egg-info') for part in parents):
+                continue
+            if path.is_file():
+                found.append(path)
+    return sorted(found)
+
+
+class FindSourceFilesTests(ScannerTestCase):
+    """
+    Check that the scandir walk finds what the rglob version did.
+    
+    Created: October 14, 2026
+    """
+    
+    def setUp(self):
+        super().setUp()
+        # The tree is put under a directory named like an excluded one,
+        # which must not hide anything inside it
+        self.tree = self.root / 'build' / 'project'
+        files = [
+            'a.py', 'b.c', 'c.h', 'notes.txt', 'setup.cfg',
+            'pkg/__init__.py', 'pkg/mod.py', 'pkg/sub/deep.py', 'pkg/sub/deep.c',
+            # Hidden files and directories aren't excluded
+            '.hidden.py', '.hidden/h.py', '.config/tool/t.py',
+            # Excluded directories, at the top and further down
+            'build/skip.py', 'dist/skip.py', '.venv/lib/skip.py', 'venv/skip.py',
+            'env/skip.py', 'ENV/skip.py', '__pycache__/skip.py', '.git/hooks/skip.py',
+            'node_modules/m/skip.c', '.tox/py311/skip.py', '.pytest_cache/skip.py',
+            '.eggs/skip.py', 'thing.egg-info/skip.py', 'pkg/build/skip.py',
+            'pkg/sub/__pycache__/skip.py',
+            # Names that only look like excluded ones
+            'builder/ok.py', 'my_env/ok.py', 'egg-info/ok.py', 'pkg/distutils/ok.py',
+            # A directory named like a source file
+            'dir.py/inner.py',
+        ]
+        for name in files:
+            path = self.tree / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("def f():\n    pass\n")
+    
+    def assert_same_as_rglob(self):
+        """
+        Compare find_source_files with the reference for every option.
+        
+        Created: October 14, 2026
+        """
+        for recursive in (True, False):
+            for include_c in (False, True):
+                with self.subTest(recursive=recursive, include_c=include_c):
+                    self.assertEqual(
+                        find_source_files(self.tree, recursive, include_c),
+                        _rglob_reference(self.tree, recursive, include_c)
+                    )
+    
+    def test_same_files_as_rglob(self):
+        self.assert_same_as_rglob()
+        found = [path.relative_to(self.tree).as_posix()
+                 for path in find_source_files(self.tree, include_c=True)]
+        self.assertIn('.hidden/h.py', found)
+        self.assertIn('pkg/sub/deep.c', found)
+        self.assertIn('dir.py/inner.py', found)
+        self.assertNotIn('dir.py', found)
+        self.assertFalse([name for name in found if name.endswith('skip.py')])
+        self.assertEqual(len(found), 15)
+    
+    @unittest.skipUnless(hasattr(os, 'symlink'), "needs symlinks")
+    def test_symlinks(self):
+        try:
+            # Like rglob, a linked directory isn't followed, so nothing is
+            # found twice and link cycles can't loop, but linked files are
+            # found; a broken link isn't a file
+            os.symlink(self.tree / 'pkg', self.tree / 'linked_pkg', target_is_directory=True)
+            os.symlink(self.tree, self.tree / 'pkg' / 'cycle', target_is_directory=True)
+            os.symlink(self.tree / 'a.py', self.tree / 'linked.py')
+            os.symlink(self.tree / 'missing.py', self.tree / 'broken.py')
+        except OSError:
+            self.skipTest("can't create symlinks here")
+        self.assert_same_as_rglob()
+        
+        found = {path.name for path in find_source_files(self.tree)}
+        self.assertIn('linked.py', found)
+        self.assertNotIn('broken.py', found)
+        self.assertEqual(
+            [path for path in find_source_files(self.tree) if 'linked_pkg' in path.parts or 'cycle' in path.parts],
+            []
+        )
+    
+    @unittest.skipIf(os.name == 'nt' or os.geteuid() == 0, "needs directory permissions to apply")
+    def test_unreadable_directory_is_skipped(self):
+        locked = self.tree / 'locked'
+        (locked / 'x.py').parent.mkdir()
+        (locked / 'x.py').write_text("pass\n")
+        locked.chmod(0)
+        self.addCleanup(locked.chmod, 0o755)
+        self.assertNotIn(locked / 'x.py', find_source_files(self.tree))
+        self.assertIn(self.tree / 'a.py', find_source_files(self.tree))
+
+
+def _metrics(*complexities):
+    """
+    Build one FunctionMetrics per complexity given.
+    
+    Created: October 14, 2026
+    """
+    metrics = []
+    for lineno, complexity in enumerate(complexities, start=1):
+        m = scanner.FunctionMetrics(f'f{lineno}', lineno)
+        m.cyclomatic_complexity = complexity
+        metrics.append(m)
+    return metrics
+
+
+class ProjectMetricsTests(unittest.TestCase):
+    """
+    Check that the running totals always match the stored metrics.
+    
+    Created: October 14, 2026
+    """
+    
+    def assert_totals_match(self, project):
+        """
+        Recompute every total from file_metrics and compare.
+        
+        Created: October 14, 2026
+        """
+        functions = [m for metrics in project.file_metrics.values() for m in metrics]
+        complexities = [m.cyclomatic_complexity for m in functions]
+        self.assertEqual(project.total_files, len(project.file_metrics))
+        self.assertEqual(project.total_functions, len(functions))
+        self.assertEqual(project.get_all_functions(), functions)
+        self.assertEqual(project.get_max_complexity(), max(complexities, default=0))
+        self.assertAlmostEqual(
+            project.get_average_complexity(),
+            sum(complexities) / len(complexities) if complexities else 0.0
+        )
+    
+    def test_totals_match_recomputation(self):
+        project = ProjectMetrics()
+        self.assert_totals_match(project)
+        project.add_file(Path('a.py'), _metrics(3, 9))
+        project.add_file(Path('b.py'), [])
+        project.add_file(Path('c.py'), _metrics(1, 1, 4))
+        self.assert_totals_match(project)
+    
+    def test_adding_a_file_again_replaces_it(self):
+        project = ProjectMetrics()
+        project.add_file(Path('a.py'), _metrics(3, 9))
+        project.add_file(Path('b.py'), _metrics(2))
+        # The new metrics lower the maximum, which has to be recomputed
+        project.add_file(Path('a.py'), _metrics(5))
+        self.assert_totals_match(project)
+        self.assertEqual(project.total_files, 2)
+        self.assertEqual(project.get_max_complexity(), 5)
+        self.assertEqual(list(project.file_metrics), [Path('b.py'), Path('a.py')])
+    
+    def test_stored_metrics_are_read_only(self):
+        project = ProjectMetrics()
+        metrics = _metrics(3)
+        project.add_file(Path('a.py'), metrics)
+        
+        with self.assertRaises(TypeError):
+            project.file_metrics[Path('b.py')] = _metrics(1)
+        with self.assertRaises(AttributeError):
+            project.file_metrics[Path('a.py')].append(_metrics(1)[0])
+        with self.assertRaises(AttributeError):
+            project.total_files = 10
+        # Changing the list that was passed in doesn't reach the project
+        metrics.append(_metrics(20)[0])
+        self.assert_totals_match(project)
+        self.assertEqual(project.get_max_complexity(), 3)
+    
+    def test_scan_totals_match_recomputation(self):
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.dict(os.environ, {'CODECOMPLEXITY_NO_CACHE': '1'}):
+            for i in range(4):
+                Path(directory, f'm{i}.py').write_text(
+                    "def f(x):\n" + "    if x:\n        pass\n" * i + "    return x\n"
+                )
+            self.assert_totals_match(analyze_directory(Path(directory)))
+
+
+class SortOrderTests(ScannerTestCase):
+    """
+    Check that files come out in the order sorting Path objects gives.
+    
+    Created: October 14, 2026
+    """
+    
+    # Names where a plain string sort differs from Path's part-wise sort,
+    # because '-', '.', '0' and others sort before or after the separator
+    _NAMES = [
+        'a-b/x.py', 'a/x.py', 'a.b/x.py', 'ab/x.py', 'a/b/x.py', 'a/a.py',
+        'a0/x.py', 'a_/x.py', 'a b/x.py', 'A/x.py', 'é/x.py', 'x.py', 'a.py',
+        'a/b-c.py', 'a/b/c.py', 'a/b.py',
+    ]
+    
+    def test_same_order_as_sorted_paths(self):
+        for name in self._NAMES:
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("pass\n")
+        
+        found = find_source_files(self.root)
+        self.assertEqual(found, sorted(found))
+        self.assertEqual(found, sorted(self.root / name for name in self._NAMES))
+    
+    def test_sort_key(self):
+        paths = [os.path.join(*name.split('/')) for name in self._NAMES]
+        by_key = sorted(paths, key=scanner._path_sort_key)
+        self.assertEqual(by_key, [os.fspath(path) for path in sorted(map(Path, paths))])
+        if os.name == 'posix':
+            self.assertEqual(by_key, [
+                'A/x.py', 'a/a.py', 'a/b/c.py', 'a/b/x.py', 'a/b-c.py', 'a/b.py',
+                'a/x.py', 'a b/x.py', 'a-b/x.py', 'a.b/x.py', 'a.py', 'a0/x.py',
+                'a_/x.py', 'ab/x.py', 'x.py', 'é/x.py',
+            ])
+
+
+class ParallelScanTests(ScannerTestCase):
+    """
+    Check that a parallel scan gives the same results as a serial one.
+    
+    Created: October 14, 2026
+    """
+    
+    def test_parallel_matches_serial_with_callback(self):
+        self.write_files(9)
+        serial = analyze_directory(self.root)
+        
+        calls = []
+        parallel = analyze_directory(
+            self.root, jobs=2,
+            progress_callback=lambda filepath, total, index: calls.append((filepath, total, index))
+        )
+        self.assertEqual(_summary(parallel), _summary(serial))
+        self.assertEqual(parallel.total_functions, serial.total_functions)
+        self.assertEqual(parallel.get_average_complexity(), serial.get_average_complexity())
+        self.assertEqual(parallel.get_max_complexity(), serial.get_max_complexity())
+        # Reported once per file, in file order
+        self.assertEqual(calls, [(filepath, 9, index) for index, filepath in enumerate(serial.file_metrics, start=1)])
+
+
+
+class FileKeyCacheTests(ScannerTestCase):
+    """
+    Check that a re-scan reuses results by path, mtime and size.
+    
+    Created: October 14, 2026
+    """
+    
+    def setUp(self):
+        super().setUp()
+        # Outside the tree being scanned
+        cache_home = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_home.cleanup)
+        self.cache_dir = Path(cache_home.name)
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': str(self.cache_dir)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        del os.environ['CODECOMPLEXITY_NO_CACHE']
+        
+        patcher = mock.patch.object(_cache, '_prune_checked', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.write_files(4)
+        self.c_file = self.root / 'native.c'
+        self.c_file.write_text("int g(int x) { if (x) return 1; return 0; }\n")
+    
+    def scan(self, **kwargs):
+        """
+        Scan the tree serially, counting the files read and analyzed.
+        
+        Returns:
+            Tuple of (project, number of files read, number analyzed)
+            
+        Created: October 14, 2026
+        """
+        with mock.patch.object(scanner, '_read_source', wraps=scanner._read_source) as read, \
+                mock.patch.object(scanner, 'analyze_python_source',
+                                  wraps=scanner.analyze_python_source) as analyze_python, \
+                mock.patch.object(scanner, 'analyze_source_file',
+                                  wraps=scanner.analyze_source_file) as analyze_other:
+            project = analyze_directory(self.root, include_c=True, **kwargs)
+        return project, read.call_count, analyze_python.call_count + analyze_other.call_count
+    
+    def test_unchanged_files_arent_read(self):
+        first, reads, analyzed = self.scan()
+        self.assertEqual((reads, analyzed), (4, 5))
+        # One entry per file: Python files aren't also cached by content
+        self.assertEqual(len(os.listdir(self.cache_dir / 'codecomplexity')), 5)
+        
+        second, reads, analyzed = self.scan()
+        self.assertEqual((reads, analyzed), (0, 0))
+        self.assertEqual(_summary(second), _summary(first))
+    
+    def test_edited_file_is_analyzed_again(self):
+        self.scan()
+        edited = self.root / 'pkg0' / 'mod0.py'
+        st = edited.stat()
+        edited.write_text("def renamed(x):\n    return x\n")
+        os.utime(edited, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        
+        project, reads, analyzed = self.scan()
+        self.assertEqual((reads, analyzed), (1, 1))
+        self.assertEqual([m.name for m in project.file_metrics[edited]], ['renamed'])
+    
+    def test_pycparser_results_are_kept_apart(self):
+        self.scan()
+        fake = [scanner.FunctionMetrics('from_pycparser', 1)]
+        with mock.patch('codecomplexity.c_analyzer.analyze_c_file', return_value=fake):
+            project, _, analyzed = self.scan(use_pycparser=True)
+        # Only the C file is analyzed again, by the other analyzer
+        self.assertEqual(analyzed, 1)
+        self.assertEqual([m.name for m in project.file_metrics[self.c_file]], ['from_pycparser'])
+        
+        project, _, analyzed = self.scan()
+        self.assertEqual(analyzed, 0)
+        self.assertEqual([m.name for m in project.file_metrics[self.c_file]], ['g'])
+
+
+
+class StreamTests(ScannerTestCase):
+    """
+    Check that a streamed scan reports exactly what a collected one keeps.
+    
+    Created: October 14, 2026
+    """
+    
+    def test_stream_matches_collected(self):
+        self.write_files(7)
+        # A file that can't be parsed is reported with None
+        broken = self.root / 'pkg0' / 'broken.py'
+        broken.write_text("def f(:\n")
+        
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                collected = analyze_directory(self.root, jobs=jobs)
+                
+                calls = []
+                streamed = analyze_directory(
+                    self.root, jobs=jobs, stream=True,
+                    progress_callback=lambda *args: calls.append(args)
+                )
+                
+                # The same files, in the same order, with the same metrics
+                self.assertEqual([(filepath, 8, index) for filepath, _, index, _ in calls],
+                                 [(filepath, 8, index) for index, filepath in
+                                  enumerate(sorted([*collected.file_metrics, broken]), start=1)])
+                delivered = {filepath: metrics for filepath, _, _, metrics in calls}
+                self.assertIsNone(delivered.pop(broken))
+                stand_in = scanner.ProjectMetrics()
+                for filepath, metrics in delivered.items():
+                    stand_in.add_file(filepath, metrics)
+                self.assertEqual(_summary(stand_in), _summary(collected))
+                
+                # The same totals, with nothing kept per file
+                self.assertEqual(streamed.file_metrics, {})
+                for name in ('total_files', 'total_functions'):
+                    self.assertEqual(getattr(streamed, name), getattr(collected, name))
+                self.assertEqual(streamed.get_average_complexity(), collected.get_average_complexity())
+                self.assertEqual(streamed.get_max_complexity(), collected.get_max_complexity())
+                self.assertEqual(collected.total_files, 7)
+
+
+class ProgressIntervalTests(ScannerTestCase):
+    """
+    Check how often progress_interval lets the callback through.
+    
+    Created: October 14, 2026
+    """
+    
+    def indexes(self, **kwargs):
+        """
+        Scan the tree and return the indexes the callback was called with.
+        
+        Created: October 14, 2026
+        """
+        calls = []
+        analyze_directory(self.root, progress_callback=lambda *args: calls.append(args[2]), **kwargs)
+        return calls
+    
+    def test_every_nth_file_and_the_last(self):
+        self.write_files(8)
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                self.assertEqual(self.indexes(jobs=jobs), [1, 2, 3, 4, 5, 6, 7, 8])
+                self.assertEqual(self.indexes(jobs=jobs, progress_interval=3), [3, 6, 8])
+                # The last file is reported once, even when it's an Nth file
+                self.assertEqual(self.indexes(jobs=jobs, progress_interval=4), [4, 8])
+                self.assertEqual(self.indexes(jobs=jobs, progress_interval=100), [8])
+    
+    def test_intervals_below_one_report_every_file(self):
+        self.write_files(3)
+        for interval in (0, -5):
+            self.assertEqual(self.indexes(progress_interval=interval), [1, 2, 3])
+    
+    def test_stream_ignores_interval(self):
+        self.write_files(5)
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs):
+                self.assertEqual(self.indexes(jobs=jobs, stream=True, progress_interval=2),
+                                 [1, 2, 3, 4, 5])
+    
+    def test_empty_tree(self):
+        self.assertEqual(self.indexes(progress_interval=3), [])
+
+
+if __name__ == '__main__':
+    unittest.main()